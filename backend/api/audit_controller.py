@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Query, Depends, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from datetime import datetime, date
 from typing import List, Optional, Dict, Any
 
@@ -32,12 +32,12 @@ async def export_logs(
     logger: AuditLogger = Depends(get_audit_logger)
 ):
     """Export logs as a JSON file."""
-    # We use a custom response because export_logs returns a stringified JSON blob
+    # export_logs already returns serialized JSON, so stream it as-is instead of
+    # decoding it only for JSONResponse to encode it again
     json_str = logger.export_logs(date_from, date_to)
-    import json
-    parsed = json.loads(json_str) # Decode memory block and wrap as response
-    return JSONResponse(
-        content=parsed,
+    return Response(
+        content=json_str,
+        media_type="application/json",
         headers={"Content-Disposition": f"attachment; filename=audit_logs_{date_from}_to_{date_to}.json"}
     )
 
@@ -26,20 +26,30 @@ class CRMStore:
         self.opportunities: Dict[str, Opportunity] = {}
         self.orders: Dict[str, Order] = {}
         
+        # Secondary index: order_status -> {order_id: Order}. get_order() hands
+        # out the live Order, so status changes must go through set_order_status()
+        self._orders_by_status: Dict[str, Dict[str, Order]] = {}
+        
         # Load up data from Epic 1 synthetic generation
-        self.load_seed_data()
+        if os.path.isdir(self.data_dir):
+            self.load_seed_data()
 
     def _parse_datetime(self, dt_str: str) -> datetime:
         """Parses a datetime string and ensures it's timezone-aware (UTC)."""
         dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S.%f")
         return dt.replace(tzinfo=timezone.utc)
         
-    def load_seed_data(self):
-        """Loads contacts, deals, opportunities, and orders from generated JSONs."""
+    def reset(self):
+        """Empties the store in place without touching the filesystem."""
         self.contacts.clear()
         self.deals.clear()
         self.opportunities.clear()
         self.orders.clear()
+        self._orders_by_status.clear()
+
+    def load_seed_data(self):
+        """Loads contacts, deals, opportunities, and orders from generated JSONs."""
+        self.reset()
 
         # Load Contacts
         try:
@@ -147,7 +157,7 @@ class CRMStore:
                         approved_by="system" if approval_status == "approved" else None,
                         approved_at=self._parse_datetime(item.get("order_date", "2025-01-01 00:00:00.0")) if approval_status == "approved" else None
                     )
-                    self.orders[o.order_id] = o
+                    self._put_order(o)
         except FileNotFoundError:
             print("Warning: orders.json not found. Starting empty.")
 
@@ -219,11 +229,29 @@ class CRMStore:
             raise CRMException("Referenced deal_id does not exist", 409)
         self.opportunities[opp.opportunity_id] = opp
 
+    def add_opportunities(self, opps: List[Opportunity]):
+        """Bulk insert; all references are validated before any opportunity is stored."""
+        for opp in opps:
+            if opp.contact_id not in self.contacts:
+                raise CRMException("Referenced contact_id does not exist", 409)
+            if opp.deal_id not in self.deals:
+                raise CRMException("Referenced deal_id does not exist", 409)
+        self.opportunities.update((opp.opportunity_id, opp) for opp in opps)
+
     # --- Orders DB Operations ---
+    def _put_order(self, order: Order):
+        """Stores an order and keeps the status index in sync."""
+        previous = self.orders.get(order.order_id)
+        if previous is not None:
+            self._orders_by_status.get(previous.order_status, {}).pop(order.order_id, None)
+        self.orders[order.order_id] = order
+        self._orders_by_status.setdefault(order.order_status, {})[order.order_id] = order
+
     def get_orders(self, status: Optional[str] = None, date_from: Optional[date] = None, date_to: Optional[date] = None, page: int = 1, page_size: int = 20):
-        items = list(self.orders.values())
         if status:
-            items = [o for o in items if o.order_status == status]
+            items = list(self._orders_by_status.get(status, {}).values())
+        else:
+            items = list(self.orders.values())
         if date_from:
             dt_from = datetime.combine(date_from, datetime.min.time()).replace(tzinfo=timezone.utc)
             items = [o for o in items if o.order_date >= dt_from]
@@ -244,4 +272,26 @@ class CRMStore:
             raise CRMException("Referenced contact_id does not exist", 409)
         if order.opportunity_id not in self.opportunities:
             raise CRMException("Referenced opportunity_id does not exist", 409)
-        self.orders[order.order_id] = order
+        self._put_order(order)
+
+    def add_orders(self, orders: List[Order]):
+        """Bulk insert; all references are validated before any order is stored."""
+        for order in orders:
+            if order.contact_id not in self.contacts:
+                raise CRMException("Referenced contact_id does not exist", 409)
+            if order.opportunity_id not in self.opportunities:
+                raise CRMException("Referenced opportunity_id does not exist", 409)
+        for order in orders:
+            self._put_order(order)
+
+    def set_order_status(self, order_id: str, order_status: str) -> Order:
+        """
+        The only supported way to change an order's status: it moves the order
+        between status index buckets. Assigning order.order_status directly
+        leaves get_orders(status=...) returning stale results.
+        """
+        order = self.get_order(order_id)
+        self._orders_by_status.get(order.order_status, {}).pop(order_id, None)
+        order.order_status = order_status
+        self._orders_by_status.setdefault(order_status, {})[order_id] = order
+        return order
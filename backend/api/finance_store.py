@@ -18,7 +18,8 @@ class FinanceStore:
         self.ledger: Dict[str, LedgerEntry] = {}
         
         # Load Epic 1 Seed Data if it exists
-        self._load_seed_data()
+        if os.path.isdir(self.data_dir):
+            self._load_seed_data()
 
     @staticmethod
     def _parse_date(value: str):
@@ -26,12 +27,16 @@ class FinanceStore:
         # Handles both 'YYYY-MM-DD HH:MM:SS.ffffff' and 'YYYY-MM-DD' formats.
         return date.fromisoformat(value.split(" ")[0].split("T")[0])
 
-    def _load_seed_data(self):
-        """Loads seeded JSON generated from Data Simulation epic."""
+    def reset(self):
+        """Empties the store in place without touching the filesystem."""
         self.invoices.clear()
         self.payments.clear()
         self.ledger.clear()
 
+    def _load_seed_data(self):
+        """Loads seeded JSON generated from Data Simulation epic."""
+        self.reset()
+
         invoices_path = os.path.join(self.data_dir, "invoices.json")
         payments_path = os.path.join(self.data_dir, "payments.json")
         ledger_path = os.path.join(self.data_dir, "ledger_entries.json")
@@ -119,6 +124,9 @@ class FinanceStore:
     def save_invoice(self, invoice: Invoice):
         self.invoices[invoice.invoice_id] = invoice
 
+    def save_invoices(self, invoices: List[Invoice]):
+        self.invoices.update((inv.invoice_id, inv) for inv in invoices)
+
     def get_payment(self, payment_id: str) -> Optional[Payment]:
         return self.payments.get(payment_id)
 
@@ -128,6 +136,9 @@ class FinanceStore:
     def save_payment(self, payment: Payment):
         self.payments[payment.payment_id] = payment
 
+    def save_payments(self, payments: List[Payment]):
+        self.payments.update((p.payment_id, p) for p in payments)
+
     def list_ledger(self) -> List[LedgerEntry]:
         return list(self.ledger.values())
 
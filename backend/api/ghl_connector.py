@@ -245,8 +245,7 @@ def update_order_status(id: str, status_update: OrderStatusUpdate, store: CRMSto
         if status_update.order_status in ["confirmed", "fulfilled"] and existing.approval_status != "approved":
              raise CRMException(f"Cannot transition order to {status_update.order_status} without approval", 409)
              
-        existing.order_status = status_update.order_status
-        return existing
+        return store.set_order_status(id, status_update.order_status)
     except CRMException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
 
@@ -1,7 +1,8 @@
 import uuid
+from contextvars import ContextVar, Token
 from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException, Depends, status
 
@@ -22,14 +23,31 @@ _store = FinanceStore()
 _ledger = LedgerService(_store)
 _rules = FinanceBusinessRules(_store, _ledger)
 
+# Context-local replacement for the singletons above (e.g. an isolated store in tests)
+_finance_ctx: ContextVar[Optional[Tuple[FinanceStore, LedgerService, FinanceBusinessRules]]] = ContextVar(
+    "finance_ctx", default=None
+)
+
+def use_store(store: FinanceStore) -> Token:
+    """Routes get_store/get_ledger/get_rules to `store` for the current context."""
+    ledger = LedgerService(store)
+    return _finance_ctx.set((store, ledger, FinanceBusinessRules(store, ledger)))
+
+def reset_store(token: Token) -> None:
+    """Restores whatever use_store() replaced."""
+    _finance_ctx.reset(token)
+
 def get_store() -> FinanceStore:
-    return _store
+    ctx = _finance_ctx.get()
+    return ctx[0] if ctx else _store
 
 def get_rules() -> FinanceBusinessRules:
-    return _rules
+    ctx = _finance_ctx.get()
+    return ctx[2] if ctx else _rules
 
 def get_ledger() -> LedgerService:
-    return _ledger
+    ctx = _finance_ctx.get()
+    return ctx[1] if ctx else _ledger
 
 # ---------------------------------------------------------
 # Invoice Endpoints
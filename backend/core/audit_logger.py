@@ -1,8 +1,10 @@
-import json
 import uuid
 from datetime import datetime, date, timezone
+from decimal import Decimal
 from typing import List
 
+import orjson
+
 from backend.core.audit_models import AuditLogEntry, AuditSummary, RuleResult, ValidationResult
 from backend.core.audit_store import AuditStore
 
@@ -88,40 +90,7 @@ class AuditLogger:
 
     def get_summary(self) -> AuditSummary:
         """Compute an overview of the audit traces."""
-        logs = self.store.get_all_logs()
-        
-        events_by_type = {}
-        events_by_severity = {}
-        events_by_decision = {}
-        
-        earliest_date = None
-        latest_date = None
-
-        for log in logs:
-            events_by_type[log.event_type] = events_by_type.get(log.event_type, 0) + 1
-            if log.severity:
-                events_by_severity[log.severity] = events_by_severity.get(log.severity, 0) + 1
-            if log.decision:
-                events_by_decision[log.decision] = events_by_decision.get(log.decision, 0) + 1
-
-            if earliest_date is None or log.timestamp < earliest_date:
-                earliest_date = log.timestamp
-            if latest_date is None or log.timestamp > latest_date:
-                latest_date = log.timestamp
-
-        date_range = {}
-        if earliest_date:
-            date_range["earliest"] = earliest_date.isoformat()
-        if latest_date:
-            date_range["latest"] = latest_date.isoformat()
-
-        return AuditSummary(
-            total_events=len(logs),
-            events_by_type=events_by_type,
-            events_by_severity=events_by_severity,
-            events_by_decision=events_by_decision,
-            date_range=date_range
-        )
+        return self.store.get_summary()
 
     def export_logs(self, date_from: date, date_to: date) -> str:
         """Exports logs to a JSON formatted string based on date."""
@@ -130,13 +99,11 @@ class AuditLogger:
         
         logs, _ = self.store.query_logs(date_from=dt_from, date_to=dt_to, page=1, page_size=1000000)
         
-        # Helper to serialize datetimes
+        # orjson serializes datetimes natively; Decimals can appear in rule details
         def default_serializer(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            if isinstance(obj, date):
-                return obj.isoformat()
+            if isinstance(obj, Decimal):
+                return str(obj)
             raise TypeError(f"Type {type(obj)} not serializable")
             
         export_data = [log.model_dump() for log in logs]
-        return json.dumps(export_data, default=default_serializer, indent=2)
+        return orjson.dumps(export_data, default=default_serializer, option=orjson.OPT_INDENT_2).decode()
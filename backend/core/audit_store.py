@@ -1,24 +1,53 @@
-import json
+import bisect
 import os
+import uuid
 from datetime import datetime, date
-from typing import List, Optional, Dict, Tuple
+from typing import List, Optional, Dict, Tuple, Union
 
-from backend.core.audit_models import AuditLogEntry
+from backend.core.audit_models import AuditLogEntry, AuditSummary
 
 
 class AuditStore:
-    """Handles file-based persistence and in-memory indexing of audit logs."""
+    """
+    Handles file-based persistence and in-memory indexing of audit logs.
+    Passing log_dir=None keeps logs in memory only, without touching disk.
+    """
     
-    def __init__(self, log_dir: str = "logs"):
+    def __init__(self, log_dir: Optional[str] = "logs"):
         self.log_dir = log_dir
-        os.makedirs(self.log_dir, exist_ok=True)
         
-        # In-memory indexes
+        self._clear_indexes()
+        
+        if self.log_dir is not None:
+            os.makedirs(self.log_dir, exist_ok=True)
+            self._load_all_logs()
+
+    def _clear_indexes(self):
+        """Resets the in-memory indexes and running summary counters."""
         self._logs_by_tx: Dict[str, List[AuditLogEntry]] = {}
-        self._logs_by_corr: Dict[str, List[AuditLogEntry]] = {}
+        self._logs_by_corr: Dict[Union[int, str], List[AuditLogEntry]] = {}
         self._all_logs: List[AuditLogEntry] = []
         
-        self._load_all_logs()
+        # Timestamp-sorted sidecar (parallel lists) so date filters can bisect
+        self._times: List[datetime] = []
+        self._logs_by_time: List[AuditLogEntry] = []
+        
+        # Running aggregates so summaries never rescan the full log list
+        self._count_by_type: Dict[str, int] = {}
+        self._count_by_severity: Dict[str, int] = {}
+        self._count_by_decision: Dict[str, int] = {}
+        self._earliest: Optional[datetime] = None
+        self._latest: Optional[datetime] = None
+
+    @staticmethod
+    def _corr_key(correlation_id: Union[int, str]) -> Union[int, str]:
+        """Index key for a correlation_id: UUIDs as 128-bit ints, anything else verbatim."""
+        if isinstance(correlation_id, int):
+            return correlation_id
+        try:
+            return uuid.UUID(correlation_id).int
+        except ValueError:
+            return correlation_id
 
     def _get_log_file_path(self, log_date: date) -> str:
         date_str = log_date.strftime("%Y-%m-%d")
@@ -34,29 +63,56 @@ class AuditStore:
                         for line in f:
                             if not line.strip():
                                 continue
-                            data = json.loads(line)
-                            entry = AuditLogEntry(**data)
-                            self._index_log(entry)
+                            entry = AuditLogEntry.model_validate_json(line)
+                            self._index_log(entry, time_sorted=False)
                 except Exception as e:
                     # Depending on strictness, we might log this or raise
                     print(f"Error loading logs from {filepath}: {e}")
+        self._sort_time_index()
 
-    def _index_log(self, entry: AuditLogEntry):
-        """Indexes a single log entry into memory."""
+    def _sort_time_index(self):
+        """Rebuilds the timestamp-sorted sidecar from _all_logs in one sort."""
+        # Stable, so equal timestamps keep arrival order as bisect_right would
+        self._logs_by_time = sorted(self._all_logs, key=lambda log: log.timestamp)
+        self._times = [log.timestamp for log in self._logs_by_time]
+
+    def _index_log(self, entry: AuditLogEntry, time_sorted: bool = True):
+        """
+        Indexes a single log entry into memory. Bulk loaders pass
+        time_sorted=False and call _sort_time_index() once at the end instead
+        of inserting every entry into the sorted sidecar.
+        """
         self._all_logs.append(entry)
+        if time_sorted:
+            idx = bisect.bisect_right(self._times, entry.timestamp)
+            self._times.insert(idx, entry.timestamp)
+            self._logs_by_time.insert(idx, entry)
         if entry.transaction_id:
             if entry.transaction_id not in self._logs_by_tx:
                 self._logs_by_tx[entry.transaction_id] = []
             self._logs_by_tx[entry.transaction_id].append(entry)
             
         if entry.correlation_id:
-            if entry.correlation_id not in self._logs_by_corr:
-                self._logs_by_corr[entry.correlation_id] = []
-            self._logs_by_corr[entry.correlation_id].append(entry)
+            key = self._corr_key(entry.correlation_id)
+            if key not in self._logs_by_corr:
+                self._logs_by_corr[key] = []
+            self._logs_by_corr[key].append(entry)
+
+        self._count_by_type[entry.event_type] = self._count_by_type.get(entry.event_type, 0) + 1
+        if entry.severity:
+            self._count_by_severity[entry.severity] = self._count_by_severity.get(entry.severity, 0) + 1
+        if entry.decision:
+            self._count_by_decision[entry.decision] = self._count_by_decision.get(entry.decision, 0) + 1
+        if self._earliest is None or entry.timestamp < self._earliest:
+            self._earliest = entry.timestamp
+        if self._latest is None or entry.timestamp > self._latest:
+            self._latest = entry.timestamp
 
     def save_log(self, entry: AuditLogEntry):
         """Saves a single log entry to disk and memory."""
         self._index_log(entry)
+        if self.log_dir is None:
+            return
         
         filepath = self._get_log_file_path(entry.timestamp.date())
         with open(filepath, "a", encoding="utf-8") as f:
@@ -66,9 +122,9 @@ class AuditStore:
         """Get all logs for a specific transaction_id."""
         return self._logs_by_tx.get(transaction_id, [])
 
-    def get_by_correlation(self, correlation_id: str) -> List[AuditLogEntry]:
-        """Get all logs for a specific correlation_id."""
-        return self._logs_by_corr.get(correlation_id, [])
+    def get_by_correlation(self, correlation_id: Union[int, str]) -> List[AuditLogEntry]:
+        """Get all logs for a specific correlation_id (UUID string or its integer form)."""
+        return self._logs_by_corr.get(self._corr_key(correlation_id), [])
 
     def query_logs(self, 
                    event_type: Optional[str] = None,
@@ -81,7 +137,12 @@ class AuditStore:
                    page: int = 1,
                    page_size: int = 50) -> Tuple[List[AuditLogEntry], int]:
         """Queries logs with given filters and returns paginated results and total count."""
-        results = self._all_logs
+        if date_from or date_to:
+            lo = bisect.bisect_left(self._times, date_from) if date_from else 0
+            hi = bisect.bisect_right(self._times, date_to) if date_to else len(self._times)
+            results = self._logs_by_time[lo:hi]
+        else:
+            results = self._all_logs
 
         if transaction_id:
             results = [log for log in results if log.transaction_id == transaction_id]
@@ -93,10 +154,6 @@ class AuditStore:
             results = [log for log in results if log.decision == decision]
         if source:
             results = [log for log in results if log.source == source]
-        if date_from:
-            results = [log for log in results if log.timestamp >= date_from]
-        if date_to:
-            results = [log for log in results if log.timestamp <= date_to]
 
         # Sort descending by timestamp
         results = sorted(results, key=lambda x: x.timestamp, reverse=True)
@@ -111,27 +168,38 @@ class AuditStore:
         """Returns all logs in memory."""
         return self._all_logs
 
+    def get_summary(self) -> AuditSummary:
+        """Returns a snapshot of the running aggregates over all logs in memory."""
+        date_range = {}
+        if self._earliest:
+            date_range["earliest"] = self._earliest.isoformat()
+        if self._latest:
+            date_range["latest"] = self._latest.isoformat()
+
+        return AuditSummary(
+            total_events=len(self._all_logs),
+            events_by_type=dict(self._count_by_type),
+            events_by_severity=dict(self._count_by_severity),
+            events_by_decision=dict(self._count_by_decision),
+            date_range=date_range
+        )
+
     def purge_logs(self, before_date: datetime) -> int:
         """Removes log entries older than the given date."""
-        self._all_logs = [log for log in self._all_logs if log.timestamp >= before_date]
+        kept = [log for log in self._all_logs if log.timestamp >= before_date]
         
-        # Rebuild indexes
-        self._logs_by_tx.clear()
-        self._logs_by_corr.clear()
-        for log in self._all_logs:
-            if log.transaction_id:
-                if log.transaction_id not in self._logs_by_tx:
-                    self._logs_by_tx[log.transaction_id] = []
-                self._logs_by_tx[log.transaction_id].append(log)
-            if log.correlation_id:
-                if log.correlation_id not in self._logs_by_corr:
-                    self._logs_by_corr[log.correlation_id] = []
-                self._logs_by_corr[log.correlation_id].append(log)
+        # Rebuild indexes and summary counters
+        self._clear_indexes()
+        for log in kept:
+            self._index_log(log, time_sorted=False)
+        self._sort_time_index()
                 
         # Remove flat files completely if they are strictly older.
         date_cutoff = before_date.date()
         deleted_count = 0
         deleted_files = 0
+        if self.log_dir is None:
+            return deleted_files
         
         for filename in list(os.listdir(self.log_dir)):
             if filename.startswith("audit_logs_") and filename.endswith(".json"):
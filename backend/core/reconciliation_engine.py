@@ -79,6 +79,7 @@ class ReconciliationEngine:
                     )
                 ],
                 validated_at=now,
+                violation_rule_names=("Order Not Found",),
             )
             self._results[order_id] = result
             return result
@@ -157,6 +158,7 @@ class ReconciliationEngine:
             rules_warned=len([v for v in violations if v.severity in ("medium", "low")]),
             violations=violations,
             validated_at=now,
+            violation_rule_names=tuple(v.rule_name for v in violations),
         )
         self._results[order_id] = result
 
@@ -218,6 +220,7 @@ class ReconciliationEngine:
                         )
                     ],
                     validated_at=datetime.now(timezone.utc),
+                    violation_rule_names=("Ghost Invoice",),
                 )
                 self._results[inv.order_id] = ghost_result
 
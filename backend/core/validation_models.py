@@ -5,7 +5,7 @@ Defines the Pydantic schemas used across the rule engine, reconciliation
 orchestrator, and validation API endpoints.
 """
 from pydantic import BaseModel, Field
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, Tuple
 from datetime import datetime
 from decimal import Decimal
 
@@ -55,6 +55,9 @@ class ValidationResult(BaseModel):
     rules_warned: int = 0
     violations: List[RuleViolation] = Field(default_factory=list)
     validated_at: datetime
+    # Rule names of `violations`, filled in by the engine when it builds the
+    # result (like the rule counts above); internal only, never serialized
+    violation_rule_names: Tuple[str, ...] = Field(default=(), exclude=True)
 
 
 # ---------------------------------------------------------------------------
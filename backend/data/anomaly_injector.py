@@ -3,7 +3,20 @@ from typing import Dict, Any
 from datetime import datetime, timedelta
 import uuid
 
+import numpy as np
+
 from .models import GeneratedDataset, AnomalyRecord
+from .money import to_cents, to_dollars, pct_to_bp, apply_discount, scale
+
+# Fallback rate for each anomaly type when the config omits it
+DEFAULT_ANOMALY_RATES = (
+    ("missing_invoice", 0.05),
+    ("pricing_drift", 0.08),
+    ("duplicate_invoice", 0.03),
+    ("unauthorized_discount", 0.06),
+    ("payment_mismatch", 0.04),
+    ("stale_unpaid", 0.05),
+)
 
 class AnomalyInjector:
     """Applies business-realistic anomalies to clean data."""
@@ -19,10 +32,23 @@ class AnomalyInjector:
         self.rates = rates
         self.rng = rng
 
+        # Resolve every rate once rather than on each inject() call
+        (
+            self._r_missing,
+            self._r_drift,
+            self._r_dup,
+            self._r_disc,
+            self._r_pay,
+            self._r_stale,
+        ) = (rates.get(key, default) for key, default in DEFAULT_ANOMALY_RATES)
+
     def inject(self, dataset: GeneratedDataset) -> GeneratedDataset:
         """
         Iterates over the dataset and injects statistical anomalies matching the `rates` config.
 
+        Expects the layout produced by `DataIngestor.generate`: exactly one opportunity,
+        invoice, payment and ledger entry per order, stored at the order's index.
+
         Args:
             dataset (GeneratedDataset): The pristine generated dataset.
 
@@ -31,12 +57,12 @@ class AnomalyInjector:
         """
         total_txns = len(dataset.orders)
         
-        missing_inv_target = int(total_txns * self.rates.get("missing_invoice", 0.05))
-        pricing_drift_target = int(total_txns * self.rates.get("pricing_drift", 0.08))
-        duplicate_inv_target = int(total_txns * self.rates.get("duplicate_invoice", 0.03))
-        unauth_disc_target = int(total_txns * self.rates.get("unauthorized_discount", 0.06))
-        payment_mis_target = int(total_txns * self.rates.get("payment_mismatch", 0.04))
-        stale_unpaid_target = int(total_txns * self.rates.get("stale_unpaid", 0.05))
+        missing_inv_target = int(total_txns * self._r_missing)
+        pricing_drift_target = int(total_txns * self._r_drift)
+        duplicate_inv_target = int(total_txns * self._r_dup)
+        unauth_disc_target = int(total_txns * self._r_disc)
+        payment_mis_target = int(total_txns * self._r_pay)
+        stale_unpaid_target = int(total_txns * self._r_stale)
 
         indices = list(range(total_txns))
         self.rng.shuffle(indices)
@@ -53,25 +79,34 @@ class AnomalyInjector:
         payment_mis_idx = set(indices[start:start+payment_mis_target])
         start += payment_mis_target
         stale_unpaid_idx = set(indices[start:start+stale_unpaid_target])
-
-        manifest = []
-        new_invoices = []
-        new_payments = []
-        new_ledger = []
+        max_anomalies = start + stale_unpaid_target
+
+        # Every anomaly emits at most one manifest record, so both outputs are
+        # pre-sized to their upper bound and trimmed once after the loop
+        manifest = [None] * max_anomalies
+        n_anomalies = 0
+        duplicate_invoices = [None] * duplicate_inv_target
+        n_duplicates = 0
         
         now = datetime.now()
 
-        invoice_lookup = {i.order_id: i for i in dataset.invoices}
-        payment_lookup = {p.invoice_id: p for p in dataset.payments}
-        ledger_lookup = {l.invoice_id: l for l in dataset.ledger_entries}
+        # Related records share the order's row index, so removals are tracked
+        # as positional masks and applied once after the loop
+        invoices = dataset.invoices
+        payments = dataset.payments
+        ledger_entries = dataset.ledger_entries
+        keep_invoice = np.ones(total_txns, dtype=bool)
+        keep_payment = np.ones(total_txns, dtype=bool)
+        keep_ledger = np.ones(total_txns, dtype=bool)
 
         for i, order in enumerate(dataset.orders):
-            invoice = invoice_lookup.get(order.order_id)
-            payment = payment_lookup.get(invoice.invoice_id) if invoice else None
-            ledger = ledger_lookup.get(invoice.invoice_id) if invoice else None
+            invoice = invoices[i] if i < len(invoices) else None
+            payment = payments[i] if invoice and i < len(payments) else None
+            ledger = ledger_entries[i] if invoice and i < len(ledger_entries) else None
+            record = None
 
             if i in missing_inv_idx:
-                manifest.append(AnomalyRecord(
+                record = AnomalyRecord(
                     anomaly_id=f"ANO-MISS-{order.order_id}",
                     type="missing_invoice",
                     affected_entity="invoice",
@@ -80,15 +115,15 @@ class AnomalyInjector:
                     expected_value=1.0,
                     actual_value=0.0,
                     injected_at=now
-                ))
-                invoice = None
-                payment = None
-                ledger = None
+                )
+                keep_invoice[i] = keep_payment[i] = keep_ledger[i] = False
                 
             elif i in pricing_drift_idx and invoice:
-                expected = invoice.amount_due
-                drift_type = self.rng.choice([1.05, 1.10, 0.9])
-                actual = round(expected * drift_type, 2)
+                expected_cents = to_cents(invoice.amount_due)
+                drift_factor_pct = self.rng.choice([105, 110, 90])
+                actual_cents = scale(expected_cents, drift_factor_pct)
+                expected = to_dollars(expected_cents)
+                actual = to_dollars(actual_cents)
                 
                 invoice.amount_due = actual
                 invoice.amount_paid = actual
@@ -98,7 +133,7 @@ class AnomalyInjector:
                     ledger.debit = actual
                     ledger.credit = actual
                     
-                manifest.append(AnomalyRecord(
+                record = AnomalyRecord(
                     anomaly_id=f"ANO-DRIFT-{invoice.invoice_id}",
                     type="pricing_drift",
                     affected_entity="invoice",
@@ -106,17 +141,18 @@ class AnomalyInjector:
                     related_entity_id=order.order_id,
                     expected_value=expected,
                     actual_value=actual,
-                    drift_pct=round((actual - expected) / expected * 100, 2),
+                    drift_pct=round((actual_cents - expected_cents) / expected_cents * 100, 2),
                     injected_at=now
-                ))
+                )
 
             elif i in duplicate_inv_idx and invoice:
                 new_inv_id = f"{invoice.invoice_id}-DUP"
                 dup_invoice = invoice.model_copy()
                 dup_invoice.invoice_id = new_inv_id
-                new_invoices.append(dup_invoice)
+                duplicate_invoices[n_duplicates] = dup_invoice
+                n_duplicates += 1
                 
-                manifest.append(AnomalyRecord(
+                record = AnomalyRecord(
                     anomaly_id=f"ANO-DUP-{invoice.invoice_id}",
                     type="duplicate_invoice",
                     affected_entity="invoice",
@@ -125,20 +161,21 @@ class AnomalyInjector:
                     expected_value=1.0,
                     actual_value=2.0,
                     injected_at=now
-                ))
+                )
 
             elif i in unauth_disc_idx:
-                opp_id = order.opportunity_id
-                opp = next(o for o in dataset.opportunities if o.opportunity_id == opp_id)
+                opp = dataset.opportunities[i]
                 expected_pct = opp.discount_pct
                 
                 new_pct = round(self.rng.uniform(16.0, 35.0), 1)
                 opp.discount_pct = new_pct
                 opp.approval_status = "pending"
                 
-                new_total = round((opp.quantity * opp.unit_price) * (1 - new_pct/100), 2)
+                gross_cents = opp.quantity * to_cents(opp.unit_price)
+                new_total_cents = apply_discount(gross_cents, pct_to_bp(new_pct))
+                new_total = to_dollars(new_total_cents)
                 order.total_amount = new_total
-                order.discount_applied = round((opp.quantity * opp.unit_price) - new_total, 2)
+                order.discount_applied = to_dollars(gross_cents - new_total_cents)
                 
                 if invoice:
                     invoice.amount_due = new_total
@@ -149,7 +186,7 @@ class AnomalyInjector:
                     ledger.debit = new_total
                     ledger.credit = new_total
 
-                manifest.append(AnomalyRecord(
+                record = AnomalyRecord(
                     anomaly_id=f"ANO-DISC-{opp.opportunity_id}",
                     type="unauthorized_discount",
                     affected_entity="opportunity",
@@ -158,16 +195,18 @@ class AnomalyInjector:
                     expected_value=expected_pct,
                     actual_value=new_pct,
                     injected_at=now
-                ))
+                )
 
             elif i in payment_mis_idx and invoice and payment:
-                expected = invoice.amount_due
-                actual = round(expected * self.rng.uniform(0.1, 0.9), 2)
+                expected_cents = to_cents(invoice.amount_due)
+                actual_cents = round(expected_cents * self.rng.uniform(0.1, 0.9))
+                expected = to_dollars(expected_cents)
+                actual = to_dollars(actual_cents)
                 payment.amount = actual
                 if ledger:
                     ledger.credit = actual
                     
-                manifest.append(AnomalyRecord(
+                record = AnomalyRecord(
                     anomaly_id=f"ANO-PAY-{payment.payment_id}",
                     type="payment_mismatch",
                     affected_entity="payment",
@@ -176,7 +215,7 @@ class AnomalyInjector:
                     expected_value=expected,
                     actual_value=actual,
                     injected_at=now
-                ))
+                )
 
             elif i in stale_unpaid_idx and invoice:
                 days_ago = self.rng.randint(65, 100)
@@ -185,9 +224,9 @@ class AnomalyInjector:
                 invoice.status = "unpaid"
                 invoice.amount_paid = 0.0
                 
-                payment = None
+                keep_payment[i] = False
                 
-                manifest.append(AnomalyRecord(
+                record = AnomalyRecord(
                     anomaly_id=f"ANO-STALE-{invoice.invoice_id}",
                     type="stale_unpaid",
                     affected_entity="invoice",
@@ -196,18 +235,15 @@ class AnomalyInjector:
                     expected_value=0.0,
                     actual_value=days_ago,
                     injected_at=now
-                ))
-
-            if invoice:
-                new_invoices.append(invoice)
-            if payment:
-                new_payments.append(payment)
-            if ledger:
-                new_ledger.append(ledger)
-
-        dataset.invoices = new_invoices
-        dataset.payments = new_payments
-        dataset.ledger_entries = new_ledger
-        dataset.anomaly_manifest = manifest
+                )
+
+            if record is not None:
+                manifest[n_anomalies] = record
+                n_anomalies += 1
+
+        dataset.invoices = [inv for inv, keep in zip(invoices, keep_invoice) if keep] + duplicate_invoices[:n_duplicates]
+        dataset.payments = [p for p, keep in zip(payments, keep_payment) if keep]
+        dataset.ledger_entries = [l for l, keep in zip(ledger_entries, keep_ledger) if keep]
+        dataset.anomaly_manifest = manifest[:n_anomalies]
 
         return dataset
@@ -3,8 +3,6 @@ import json
 import random
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
-from faker import Faker
-import pandas as pd
 
 from .models import (
     Contact, Deal, Opportunity, Order,
@@ -13,6 +11,7 @@ from .models import (
 )
 from .config import GENERATOR_CONFIG
 from .anomaly_injector import AnomalyInjector
+from .money import to_cents, to_dollars, pct_to_bp, apply_discount, divide
 
 class DataIngestor:
     """Orchestrates end-to-end dataset ingestion."""
@@ -24,6 +23,9 @@ class DataIngestor:
         Args:
             config (Dict[str, Any], optional): Dictionary specifying scale parameters and anomaly distributions.
         """
+        # Imported here so API workers that never generate data skip loading Faker
+        from faker import Faker
+
         self.config = config or GENERATOR_CONFIG
         self.seed = self.config.get("seed", 42)
         self.faker = Faker()
@@ -66,12 +68,12 @@ class DataIngestor:
 
             # Deal
             deal_id = f"DL-{i+1:05d}"
-            deal_value = round(self.rng.uniform(500, 10000), 2)
+            deal_cents = to_cents(self.rng.uniform(500, 10000))
             deals.append(Deal(
                 deal_id=deal_id,
                 contact_id=contact.contact_id,
                 stage="closed_won",
-                value=deal_value,
+                value=to_dollars(deal_cents),
                 assigned_to=self.faker.name(),
                 created_at=txn_date
             ))
@@ -80,7 +82,7 @@ class DataIngestor:
             opp_id = f"OPP-{i+1:05d}"
             product_id = f"PROD-{self.rng.randint(1, self.config.get('num_products', 50)):03d}"
             qty = self.rng.randint(1, 10)
-            unit_price = round(deal_value / qty, 2)
+            unit_price_cents = divide(deal_cents, qty)
             discount_pct = round(self.rng.uniform(0, 15), 1)
 
             opportunities.append(Opportunity(
@@ -88,15 +90,17 @@ class DataIngestor:
                 deal_id=deal_id,
                 product_id=product_id,
                 quantity=qty,
-                unit_price=unit_price,
+                unit_price=to_dollars(unit_price_cents),
                 discount_pct=discount_pct,
                 approval_status="approved"
             ))
 
             # Order
             order_id = f"ORD-{i+1:05d}"
-            total_amount = round((qty * unit_price) * (1 - discount_pct/100), 2)
-            discount_applied = round((qty * unit_price) - total_amount, 2)
+            gross_cents = qty * unit_price_cents
+            total_cents = apply_discount(gross_cents, pct_to_bp(discount_pct))
+            total_amount = to_dollars(total_cents)
+            discount_applied = to_dollars(gross_cents - total_cents)
             order_date = txn_date + timedelta(hours=self.rng.randint(1, 72))
 
             orders.append(Order(
@@ -196,5 +200,6 @@ class DataIngestor:
                 with open(os.path.join(output_dir, f"{name}.json"), "w") as f:
                     json.dump(data_list, f, indent=2, default=str)
             if "csv" in formats and data_list:
+                import pandas as pd
                 df = pd.DataFrame(data_list)
                 df.to_csv(os.path.join(output_dir, f"{name}.csv"), index=False)
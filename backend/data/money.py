@@ -0,0 +1,37 @@
+"""
+Integer-cent helpers for synthetic data generation.
+
+Monetary values are computed as whole cents and only converted to float
+dollars when they are stored on the Pydantic models, so intermediate
+arithmetic never needs round(x, 2).
+"""
+
+
+def to_cents(amount: float) -> int:
+    """Converts a float dollar amount to whole cents."""
+    return round(amount * 100)
+
+
+def to_dollars(cents: int) -> float:
+    """Converts whole cents back to a float dollar amount for model fields."""
+    return cents / 100
+
+
+def pct_to_bp(pct: float) -> int:
+    """Converts a percentage with up to two decimals to basis points."""
+    return round(pct * 100)
+
+
+def apply_discount(cents: int, discount_bp: int) -> int:
+    """Applies a discount given in basis points, rounding half up to the cent."""
+    return (cents * (10_000 - discount_bp) + 5_000) // 10_000
+
+
+def scale(cents: int, pct: int) -> int:
+    """Scales an amount by an integer percentage, rounding half up to the cent."""
+    return (cents * pct + 50) // 100
+
+
+def divide(cents: int, n: int) -> int:
+    """Divides an amount into n equal parts, rounding half up to the cent."""
+    return (2 * cents + n) // (2 * n)
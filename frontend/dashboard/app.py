@@ -1,13 +1,16 @@
+import hashlib
+import heapq
 import os
+import threading
 from datetime import datetime
-from typing import Optional
+from typing import List, NamedTuple, Optional, Tuple
 
-from fastapi import FastAPI, Request
+from fastapi import BackgroundTasks, FastAPI, Request
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 
 from backend.api.validation_controller import _get_engine
-from visualization.chart_exporter import ChartExporter
+from backend.core.validation_models import ValidationResult, ValidationStatistics
 
 app = FastAPI(title="Revenue Guard Dashboard")
 
@@ -17,44 +20,173 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 templates = Jinja2Templates(directory=os.path.join(BASE_DIR, "templates"))
 
 # Ensure static and charts directories exist
-os.makedirs(os.path.join(BASE_DIR, "static/charts"), exist_ok=True)
+CHART_DIR = os.path.join(BASE_DIR, "static/charts")
+os.makedirs(CHART_DIR, exist_ok=True)
+
+# Digest of the results the current PNGs were rendered from
+DIGEST_PATH = os.path.join(CHART_DIR, ".digest")
+
+# Serializes background exports and snapshot swaps so two renders never
+# write the same PNGs and an older scan never replaces a newer one
+_export_lock = threading.Lock()
+# Serializes scans so the page never reads engine results mid-rescan
+_scan_lock = threading.Lock()
+# Bumped under _scan_lock for every scan; orders snapshots by freshness
+_scan_seq = 0
+
+
+class DashboardSnapshot(NamedTuple):
+    """Results, stats and the charts rendered from them, published together."""
+    results: Tuple[ValidationResult, ...]
+    stats: ValidationStatistics
+    chart_version: Optional[str]  # None when there was nothing to chart
+    scanned_at: datetime
+    scan_seq: int
+
+
+# What GET / serves; replaced wholesale (never mutated) once charts are on disk
+_snapshot: Optional[DashboardSnapshot] = None
+
+# POST /refresh generations requested vs. finished, for GET /refresh/status
+_refresh_requested = 0
+_refresh_completed = 0
+_refresh_state_lock = threading.Lock()
 
 app.mount("/static", StaticFiles(directory=os.path.join(BASE_DIR, "static")), name="static")
 
-@app.get("/")
-async def dashboard(request: Request):
+
+def _results_digest(results: List[ValidationResult]) -> str:
+    """
+    Hashes every result field the charts are drawn from: risk score and
+    classification, validation day (the trend chart buckets by date; the
+    engine restamps validated_at on every scan) and violated rule names
+    (category chart).
+    """
+    rows = sorted(
+        (r.order_id, r.risk_score, r.risk_classification, r.validated_at.date().isoformat(),
+         tuple(v.rule_name for v in r.violations))
+        for r in results
+    )
+    payload = "\n".join(map(repr, rows)).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _read_digest() -> Optional[str]:
+    try:
+        with open(DIGEST_PATH, "r") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def _write_digest(digest: str):
+    """Publishes the digest atomically so readers never see a partial file."""
+    tmp_path = DIGEST_PATH + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(digest)
+    os.replace(tmp_path, DIGEST_PATH)
+
+
+def _export_charts(results: List[ValidationResult], digest: str, force: bool = False) -> bool:
+    """
+    Renders the dashboard charts unless the PNGs on disk were already built
+    from identical results. Returns True if an export actually ran.
+    The caller holds _export_lock.
+    """
+    charts_present = os.path.exists(os.path.join(CHART_DIR, "risk_distribution.png"))
+    if not force and charts_present and _read_digest() == digest:
+        return False
+
+    # Deferred so the dashboard worker only loads matplotlib when rendering
+    from visualization.chart_exporter import ChartExporter
+
+    exporter = ChartExporter(CHART_DIR)
+    exporter.export_all(results)
+    _write_digest(digest)
+    return True
+
+
+def _scan(rescan: bool):
+    """Returns (results, stats, scan_seq) read from the engine in one consistent pass."""
+    global _scan_seq
     engine = _get_engine()
-    
-    # Ensure some results exist for the dashboard
-    results = engine.get_all_results()
-    if not results:
-        # Trigger a full scan if no results
-        results = engine.reconcile_all()
-        
-    # Always try to export charts if they don't exist
-    chart_dir = os.path.join(BASE_DIR, "static/charts")
-    if not os.path.exists(os.path.join(chart_dir, "risk_distribution.png")):
-        exporter = ChartExporter(chart_dir)
-        exporter.export_all(results)
-    
-    stats = engine.get_statistics()
-    
+    with _scan_lock:
+        # Ensure some results exist for the dashboard
+        if rescan or not engine.get_all_results():
+            engine.reconcile_all()
+        _scan_seq += 1
+        return engine.get_all_results(), engine.get_statistics(), _scan_seq
+
+
+def _publish(results: List[ValidationResult], stats: ValidationStatistics,
+             scan_seq: int, force: bool = False) -> bool:
+    """
+    Renders the charts for results, then swaps in the snapshot GET / serves.
+    Returns False, touching nothing, if a newer scan has already been published.
+    """
+    global _snapshot
+    digest = _results_digest(results)
+    with _export_lock:
+        if _snapshot is not None and _snapshot.scan_seq > scan_seq:
+            return False
+        _export_charts(results, digest, force=force)
+        chart_version = digest if results else None
+        _snapshot = DashboardSnapshot(tuple(results), stats, chart_version, datetime.now(), scan_seq)
+    return True
+
+
+def _rescan_and_export(generation: int, force: bool = False):
+    """Runs a full reconciliation scan and re-renders the charts from it."""
+    global _refresh_completed
+    try:
+        _publish(*_scan(rescan=True), force=force)
+    finally:
+        with _refresh_state_lock:
+            _refresh_completed = max(_refresh_completed, generation)
+
+
+@app.get("/")
+async def dashboard(request: Request, background_tasks: BackgroundTasks):
+    snapshot = _snapshot
+    if snapshot is None:
+        # First visit: render the page now, and the charts after it is sent.
+        # Until then the page shows placeholders instead of missing images.
+        results, stats, scan_seq = _scan(rescan=False)
+        background_tasks.add_task(_publish, results, stats, scan_seq)
+        scanned_at = datetime.now()
+    else:
+        results, stats, scanned_at = snapshot.results, snapshot.stats, snapshot.scanned_at
+
     # Get high-risk transactions
-    high_risk = [r for r in results if r.risk_classification == 'critical']
-    high_risk = sorted(high_risk, key=lambda x: x.risk_score, reverse=True)[:10]
+    high_risk = heapq.nlargest(
+        10,
+        (r for r in results if r.risk_classification == 'critical'),
+        key=lambda x: x.risk_score,
+    )
 
-    return templates.TemplateResponse("index.html", {
-        "request": request,
+    response = templates.TemplateResponse(request, "index.html", {
         "stats": stats,
         "high_risk": high_risk,
-        "last_scan": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        "chart_version": snapshot.chart_version if snapshot else None,
+        "charts_pending": snapshot is None,
+        "last_scan": scanned_at.strftime("%Y-%m-%d %H:%M:%S")
     })
+    # Stats and chart URLs change with every refresh; never serve a cached page
+    response.headers["Cache-Control"] = "no-store"
+    return response
 
 @app.post("/refresh")
-async def refresh_dashboard():
-    engine = _get_engine()
-    results = engine.reconcile_all()
-    chart_dir = os.path.join(BASE_DIR, "static/charts")
-    exporter = ChartExporter(chart_dir)
-    exporter.export_all(results)
-    return {"status": "success", "message": "Dashboard assets refreshed"}
+async def refresh_dashboard(background_tasks: BackgroundTasks, force: bool = False):
+    global _refresh_requested
+    with _refresh_state_lock:
+        _refresh_requested += 1
+        generation = _refresh_requested
+    background_tasks.add_task(_rescan_and_export, generation, force)
+    return {"status": "scheduled", "generation": generation,
+            "message": "Dashboard asset refresh scheduled"}
+
+@app.get("/refresh/status")
+async def refresh_status(generation: int = 0):
+    """Reports whether refresh `generation` (or the cold-start render) has finished."""
+    done = _snapshot is not None and _refresh_completed >= generation
+    return {"status": "ready" if done else "pending"}
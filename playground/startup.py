@@ -2,21 +2,53 @@
 Application Lifecycle Handlers
 """
 from playground.app_config import settings
-from backend.data.data_ingestor import DataIngestor
 from backend.api.ghl_connector import get_store as get_crm_store
 from backend.api.qb_engine import get_store as get_finance_store
 from backend.api.audit_controller import get_audit_logger
-from backend.core.audit_models import AuditLogEntry
+from backend.api.crm_store import CRMStore
+from backend.api.finance_store import FinanceStore
+from playground.uuidpool import next_uuid
+import asyncio
 import os
-import uuid
 from datetime import datetime, timezone
 
+def swap_store_contents(live, fresh):
+    """
+    Rebinds every collection on the live store to the fully loaded ones of
+    fresh in a single step. The live store's old dicts are never cleared or
+    mutated, so readers mid-iteration keep a consistent (old) view.
+    """
+    vars(live).update(vars(fresh))
+
+def reload_stores_sync():
+    """Blocking reload_stores() for callers already on a worker thread."""
+    crm_store, finance_store = get_crm_store(), get_finance_store()
+    swap_store_contents(crm_store, CRMStore(data_dir=crm_store.data_dir))
+    swap_store_contents(finance_store, FinanceStore(data_dir=finance_store.data_dir))
+
+async def reload_stores():
+    """
+    Reloads the CRM and finance stores from the seed files on disk.
+    Fresh stores are loaded in worker threads concurrently so the event loop
+    stays free, then swapped into the live ones, which are never seen empty
+    or half-loaded.
+    """
+    crm_store, finance_store = get_crm_store(), get_finance_store()
+    fresh_crm, fresh_finance = await asyncio.gather(
+        asyncio.to_thread(CRMStore, data_dir=crm_store.data_dir),
+        asyncio.to_thread(FinanceStore, data_dir=finance_store.data_dir)
+    )
+    swap_store_contents(crm_store, fresh_crm)
+    swap_store_contents(finance_store, fresh_finance)
+
 async def startup_event():
     """
     Seeds data stores with synthetic dataset if they are empty or configured to seed.
     """
-    crm_store = get_crm_store()
-    finance_store = get_finance_store()
+    # Deferred so importing the ASGI app does not pull in the ingestor's dependencies
+    from backend.data.data_ingestor import DataIngestor
+    from backend.core.audit_models import AuditLogEntry
+
     audit_logger = get_audit_logger()
     
     # Check if we should seed (e.g., if data dir is empty or explicitly requested)
@@ -28,12 +60,10 @@ async def startup_event():
         dataset = ingestor.generate()
         ingestor.save(dataset, output_dir=settings.DATA_DIR)
         
-        # Reload stores
-        crm_store.load_seed_data()
-        finance_store._load_seed_data()
+        await reload_stores()
         
     audit_logger.log_event(AuditLogEntry(
-        log_id=str(uuid.uuid4()),
+        log_id=next_uuid(),
         timestamp=datetime.now(timezone.utc),
         event_type="system_startup",
         severity="info",
@@ -45,9 +75,11 @@ async def shutdown_event():
     """
     Clean up or log shutdown.
     """
+    from backend.core.audit_models import AuditLogEntry
+
     audit_logger = get_audit_logger()
     audit_logger.log_event(AuditLogEntry(
-        log_id=str(uuid.uuid4()),
+        log_id=next_uuid(),
         timestamp=datetime.now(timezone.utc),
         event_type="system_shutdown",
         severity="info",
@@ -2,16 +2,21 @@
 System Controller
 """
 from fastapi import APIRouter, BackgroundTasks
+from fastapi.responses import JSONResponse
 from playground.app_config import settings
-from backend.api.ghl_connector import get_store as get_crm_store
-from backend.api.qb_engine import get_store as get_finance_store
 from backend.data.data_ingestor import DataIngestor
+from playground.startup import reload_stores, reload_stores_sync
+import threading
 import time
 
 router = APIRouter(prefix="/system", tags=["System"])
 
 START_TIME = time.time()
 
+# Held by a running reseed job so concurrent requests cannot stack generators.
+# Only the job itself acquires it, so a job that never runs cannot leak it.
+_seed_lock = threading.Lock()
+
 @router.get("/health")
 async def health_check():
     """Returns the health status of the API."""
@@ -30,11 +35,7 @@ async def system_info():
 @router.post("/reset")
 async def reset_data():
     """Resets all in-memory data stores to the state of the seed files on disk."""
-    crm_store = get_crm_store()
-    finance_store = get_finance_store()
-    
-    crm_store.load_seed_data()
-    finance_store._load_seed_data()
+    await reload_stores()
     
     return {"status": "success", "message": "Stores reset to seed data."}
 
@@ -43,16 +44,26 @@ async def reseed_data(background_tasks: BackgroundTasks):
     """
     Trigger a fresh data ingestion and reload stores.
     This is an expensive operation and is run in the background.
+    Returns 429 while a previous reseed is still running.
     """
+    if _seed_lock.locked():
+        return JSONResponse(
+            status_code=429,
+            content={"status": "busy", "message": "Reseeding already in progress."}
+        )
+
     def generate_and_reload():
-        ingestor = DataIngestor()
-        dataset = ingestor.generate()
-        ingestor.save(dataset, output_dir=settings.DATA_DIR)
-        
-        crm_store = get_crm_store()
-        finance_store = get_finance_store()
-        crm_store.load_seed_data()
-        finance_store._load_seed_data()
+        # A job queued alongside a running one just yields to it
+        if not _seed_lock.acquire(blocking=False):
+            return
+        try:
+            ingestor = DataIngestor()
+            dataset = ingestor.generate()
+            ingestor.save(dataset, output_dir=settings.DATA_DIR)
+            
+            reload_stores_sync()
+        finally:
+            _seed_lock.release()
 
     background_tasks.add_task(generate_and_reload)
     return {"status": "accepted", "message": "Reseeding started in background."}
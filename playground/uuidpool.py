@@ -0,0 +1,42 @@
+"""
+Pooled UUID Generator
+
+Draws random bytes from os.urandom in 4 KiB blocks and slices RFC 4122
+version-4 identifiers out of the buffer, so one syscall covers 256 IDs.
+"""
+import os
+import threading
+
+_POOL_SIZE = 4096
+_UUID_BYTES = 16
+
+_lock = threading.Lock()
+_pool = bytearray(_POOL_SIZE)
+_offset = _POOL_SIZE  # Forces a refill on first use
+
+
+def _reset_pool():
+    """Discards buffered bytes so a forked worker never reuses its parent's IDs."""
+    global _offset
+    _offset = _POOL_SIZE
+
+
+# POSIX only; Windows has no fork, so there is nothing to reset there
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool)
+
+
+def next_uuid() -> str:
+    """Returns a random UUID4 string, equivalent to str(uuid.uuid4())."""
+    global _offset
+    with _lock:
+        if _offset >= _POOL_SIZE:
+            _pool[:] = os.urandom(_POOL_SIZE)
+            _offset = 0
+        raw = _pool[_offset:_offset + _UUID_BYTES]
+        _offset += _UUID_BYTES
+
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
@@ -4,10 +4,11 @@ import sys
 # Ensure backend modules can be imported
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from backend.api.validation_controller import _get_engine
-from visualization.chart_exporter import ChartExporter
-
 def main():
+    # Imported here so the engine, FastAPI and matplotlib only load once the script runs
+    from backend.api.validation_controller import _get_engine
+    from visualization.chart_exporter import ChartExporter
+
     print("Initializing Engine...")
     engine = _get_engine()
     
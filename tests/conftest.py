@@ -0,0 +1,111 @@
+import matplotlib
+
+# Headless backend for every test process (and every xdist worker)
+matplotlib.use("Agg")
+
+import sys
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from backend.api.crm_models import Order, LineItem
+from backend.api.finance_models import Invoice
+from backend.core.rule_registry import (
+    PRC001_DiscountThreshold,
+    OIC001_OrderInvoiceMapping,
+    OIC002_AmountMatching,
+)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient (and app lifespan) shared by every synchronous API test."""
+    # Imported here so tests that never touch the API skip loading the app graph
+    from fastapi.testclient import TestClient
+    from backend.main import app
+
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(autouse=True)
+def restore_dependency_overrides():
+    """Snapshot app.dependency_overrides and restore it after every test.
+
+    Keeps tests order-independent so the suite can run under ``pytest -n auto``.
+    Does nothing until some test has imported backend.main.
+    """
+    main = sys.modules.get("backend.main")
+    snapshot = dict(main.app.dependency_overrides) if main else {}
+    try:
+        yield
+    finally:
+        main = sys.modules.get("backend.main")
+        if main:
+            main.app.dependency_overrides.clear()
+            main.app.dependency_overrides.update(snapshot)
+
+
+# Validation rules are stateless, so one instance of each serves the whole session
+@pytest.fixture(scope="session")
+def prc001():
+    return PRC001_DiscountThreshold()
+
+
+@pytest.fixture(scope="session")
+def oic001():
+    return OIC001_OrderInvoiceMapping()
+
+
+@pytest.fixture(scope="session")
+def oic002():
+    return OIC002_AmountMatching()
+
+
+# Model factories shared by the rule and engine tests; each call builds fresh
+# objects (line_items included), so tests never share mutable state
+@pytest.fixture(scope="session")
+def make_order():
+    def _make_order(**overrides) -> Order:
+        defaults = dict(
+            order_id="ORD-T001",
+            opportunity_id="OPP-T",
+            contact_id="CNT-T",
+            line_items=[
+                LineItem(product_id="P1", product_name="Widget", quantity=2, unit_price=Decimal("500"), total_price=Decimal("1000"))
+            ],
+            subtotal=Decimal("1000"),
+            discount_pct=Decimal("0"),
+            discount_amount=Decimal("0"),
+            total_amount=Decimal("1000"),
+            approval_status="pending",
+            order_status="confirmed",
+            order_date=datetime(2025, 6, 1, tzinfo=timezone.utc),
+        )
+        defaults.update(overrides)
+        return Order(**defaults)
+    return _make_order
+
+
+@pytest.fixture(scope="session")
+def make_invoice():
+    def _make_invoice(**overrides) -> Invoice:
+        defaults = dict(
+            invoice_id="INV-T001",
+            order_id="ORD-T001",
+            customer_id="CNT-T",
+            line_items=[],
+            subtotal=Decimal("1000"),
+            tax_amount=Decimal("0"),
+            total_amount=Decimal("1000"),
+            amount_paid=Decimal("1000"),
+            amount_due=Decimal("0"),
+            status="paid",
+            issue_date=date(2025, 6, 1),
+            due_date=date(2025, 7, 1),
+            payment_terms="Net 30",
+        )
+        defaults.update(overrides)
+        return Invoice(**defaults)
+    return _make_invoice
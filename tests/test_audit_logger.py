@@ -7,6 +7,7 @@ import uuid
 from backend.core.audit_logger import AuditLogger
 from backend.core.audit_store import AuditStore
 from backend.core.audit_models import AuditLogEntry, RuleResult, ValidationResult
+from playground.uuidpool import next_uuid
 
 @pytest.fixture
 def mock_store_path(tmp_path):
@@ -14,9 +15,9 @@ def mock_store_path(tmp_path):
     return str(tmp_path / "logs")
 
 @pytest.fixture
-def audit_store(mock_store_path):
-    """Fixture to provide a real or mock audit store."""
-    store = AuditStore(log_dir=mock_store_path)
+def audit_store():
+    """Fixture to provide an in-memory audit store (no disk I/O)."""
+    store = AuditStore(log_dir=None)
     return store
 
 @pytest.fixture
@@ -30,7 +31,7 @@ class TestAuditLogger:
     def test_log_creation(self, audit_logger):
         """Log an event -> assert it's retrievable by log_id"""
         entry = AuditLogEntry(
-            log_id=str(uuid.uuid4()),
+            log_id=next_uuid(),
             timestamp=datetime.now(timezone.utc),
             event_type="validation_started",
             transaction_id="TX-001",
@@ -44,10 +45,10 @@ class TestAuditLogger:
 
     def test_correlation_grouping(self, audit_logger):
         """Log 5 events with same correlation_id -> assert all returned together"""
-        corr_id = str(uuid.uuid4())
+        corr_id = next_uuid()
         for i in range(5):
             entry = AuditLogEntry(
-                log_id=str(uuid.uuid4()),
+                log_id=next_uuid(),
                 timestamp=datetime.now(timezone.utc),
                 event_type="rule_evaluated",
                 transaction_id=f"TX-{i}",
@@ -59,6 +60,8 @@ class TestAuditLogger:
         logs = audit_logger.store.get_by_correlation(corr_id)
         assert len(logs) == 5
         assert all(log.correlation_id == corr_id for log in logs)
+        assert audit_logger.store.get_by_correlation(uuid.UUID(corr_id).int) == logs
+        assert audit_logger.store.get_by_correlation(corr_id.upper()) == logs
 
     def test_transaction_lookup(self, audit_logger):
         """Log events for transaction -> query by transaction_id -> assert complete"""
@@ -72,16 +75,15 @@ class TestAuditLogger:
         
         logs = audit_logger.get_logs_for_transaction(tx_id)
         assert len(logs) == 3
-        event_types = {log.event_type for log in logs}
-        assert "validation_started" in event_types
-        assert "rule_evaluated" in event_types
-        assert "risk_score_calculated" in event_types
+        assert any(log.event_type == "validation_started" for log in logs)
+        assert any(log.event_type == "rule_evaluated" for log in logs)
+        assert any(log.event_type == "risk_score_calculated" for log in logs)
 
     def test_filter_by_severity(self, audit_logger):
         """Log mixed severity events -> filter by 'critical' -> assert only critical"""
         for sev in ["low", "medium", "critical", "critical", "high"]:
             entry = AuditLogEntry(
-                log_id=str(uuid.uuid4()),
+                log_id=next_uuid(),
                 timestamp=datetime.now(timezone.utc),
                 event_type="system_error",
                 transaction_id="TX-ERR",
@@ -99,7 +101,7 @@ class TestAuditLogger:
         # Log events on different days
         for day in [14, 15, 16, 17, 18]:
             entry = AuditLogEntry(
-                log_id=str(uuid.uuid4()),
+                log_id=next_uuid(),
                 timestamp=datetime(2025, 1, day, 12, 0, 0, tzinfo=timezone.utc),
                 event_type="order_created",
                 transaction_id="TX-DATE",
@@ -112,8 +114,7 @@ class TestAuditLogger:
         
         logs, count = audit_logger.store.query_logs(date_from=date_from, date_to=date_to)
         assert count == 3
-        days = {log.timestamp.day for log in logs}
-        assert days == {15, 16, 17}
+        assert sorted(log.timestamp.day for log in logs) == [15, 16, 17]
 
     def test_file_persistence(self, mock_store_path):
         """Log events -> restart store -> assert events still queryable"""
@@ -138,6 +139,27 @@ class TestAuditLogger:
         assert len(logs) == 1
         assert logs[0].log_id == "PERSIST-123"
 
+    def test_unsorted_file_loads_time_ordered(self, mock_store_path):
+        """Out-of-order entries on disk -> date filters still see them sorted after restart"""
+        store1 = AuditStore(log_dir=mock_store_path)
+        for hour in [15, 9, 12, 6]:
+            store1.save_log(AuditLogEntry(
+                log_id=f"LOG-{hour}",
+                timestamp=datetime(2025, 3, 1, hour, 0, 0, tzinfo=timezone.utc),
+                event_type="order_created",
+                source="test"
+            ))
+
+        store2 = AuditStore(log_dir=mock_store_path)
+        assert [log.timestamp.hour for log in store2._logs_by_time] == [6, 9, 12, 15]
+
+        logs, count = store2.query_logs(
+            date_from=datetime(2025, 3, 1, 8, 0, 0, tzinfo=timezone.utc),
+            date_to=datetime(2025, 3, 1, 13, 0, 0, tzinfo=timezone.utc),
+        )
+        assert count == 2
+        assert sorted(log.log_id for log in logs) == ["LOG-12", "LOG-9"]
+
     def test_summary_accuracy(self, audit_logger):
         """Log known events -> assert summary counts match"""
         audit_logger.log_risk_score("TX-A", 90, "critical", "CORR-A")
@@ -152,11 +174,29 @@ class TestAuditLogger:
         assert summary.events_by_type["validation_completed"] == 1
         assert summary.events_by_decision.get("fail") == 1
 
+    def test_summary_after_purge(self, audit_logger):
+        """Purge old logs -> assert summary only counts what remains"""
+        for day in [1, 2, 3]:
+            audit_logger.log_event(AuditLogEntry(
+                log_id=next_uuid(),
+                timestamp=datetime(2025, 2, day, 12, 0, 0, tzinfo=timezone.utc),
+                event_type="order_created",
+                transaction_id=f"TX-P{day}",
+                source="test"
+            ))
+
+        audit_logger.store.purge_logs(datetime(2025, 2, 2, 0, 0, 0, tzinfo=timezone.utc))
+
+        summary = audit_logger.get_summary()
+        assert summary.total_events == 2
+        assert summary.events_by_type == {"order_created": 2}
+        assert summary.date_range["earliest"].startswith("2025-02-02")
+
     def test_export(self, audit_logger):
         """Export logs -> parse output -> assert valid JSON"""
         target_date = date(2025, 5, 5)
         entry = AuditLogEntry(
-            log_id=str(uuid.uuid4()),
+            log_id=next_uuid(),
             timestamp=datetime(2025, 5, 5, 12, 0, 0, tzinfo=timezone.utc),
             event_type="payment_recorded",
             transaction_id="TX-EXP",
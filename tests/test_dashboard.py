@@ -0,0 +1,103 @@
+"""
+Dashboard — chart refresh flow
+
+Runs the dashboard app against isolated stores and a temporary chart
+directory, and counts how often the chart export actually runs.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api.crm_store import CRMStore
+from backend.api.finance_store import FinanceStore
+from backend.core.reconciliation_engine import ReconciliationEngine
+from frontend.dashboard import app as dashboard
+
+
+@pytest.fixture
+def engine(make_invoice):
+    """Engine over empty stores plus one ghost invoice, so every scan has a result."""
+    crm = CRMStore(data_dir="/nonexistent")
+    fin = FinanceStore(data_dir="/nonexistent")
+    fin.save_invoice(make_invoice(order_id="ORD-GHOST"))
+    return ReconciliationEngine(crm, fin, audit_logger=None)
+
+
+@pytest.fixture
+def exports(monkeypatch, tmp_path, engine):
+    """Points the dashboard at tmp_path and engine; returns the list of export_all calls."""
+    from visualization.chart_exporter import ChartExporter
+
+    monkeypatch.setattr(dashboard, "CHART_DIR", str(tmp_path))
+    monkeypatch.setattr(dashboard, "DIGEST_PATH", str(tmp_path / ".digest"))
+    monkeypatch.setattr(dashboard, "_get_engine", lambda: engine)
+    monkeypatch.setattr(dashboard, "_snapshot", None)
+    monkeypatch.setattr(dashboard, "_scan_seq", 0)
+    monkeypatch.setattr(dashboard, "_refresh_requested", 0)
+    monkeypatch.setattr(dashboard, "_refresh_completed", 0)
+
+    calls = []
+    export_all = ChartExporter.export_all
+
+    def counting_export_all(self, results, executor=None):
+        calls.append(len(results))
+        return export_all(self, results, executor=executor)
+
+    monkeypatch.setattr(ChartExporter, "export_all", counting_export_all)
+    return calls
+
+
+@pytest.fixture
+def dashboard_client():
+    # Background tasks run before TestClient returns each response
+    return TestClient(dashboard.app)
+
+
+def test_unchanged_refresh_skips_export(exports, dashboard_client):
+    """A rescan that produces the same results leaves the charts alone."""
+    assert dashboard_client.post("/refresh").status_code == 200
+    assert len(exports) == 1
+
+    assert dashboard_client.post("/refresh").status_code == 200
+    assert len(exports) == 1
+
+
+def test_forced_refresh_reexports(exports, dashboard_client):
+    """POST /refresh?force=1 re-renders even when nothing changed."""
+    dashboard_client.post("/refresh")
+    dashboard_client.post("/refresh", params={"force": 1})
+    assert len(exports) == 2
+
+
+def test_cold_start_shows_placeholders_until_published(exports, dashboard_client):
+    """First GET / renders placeholders; its background render publishes the snapshot."""
+    res = dashboard_client.get("/")
+    assert res.status_code == 200
+    assert res.headers["cache-control"] == "no-store"
+    assert "Rendering chart" in res.text
+    assert dashboard_client.get("/refresh/status").json()["status"] == "ready"
+
+    res = dashboard_client.get("/")
+    assert f"risk_distribution.png?v={dashboard._snapshot.chart_version}" in res.text
+
+
+def test_refresh_status_tracks_generation(exports, dashboard_client):
+    """GET /refresh/status reports ready only once that generation has finished."""
+    generation = dashboard_client.post("/refresh").json()["generation"]
+
+    assert dashboard_client.get("/refresh/status", params={"generation": generation}).json() == {"status": "ready"}
+    assert dashboard_client.get("/refresh/status", params={"generation": generation + 1}).json() == {"status": "pending"}
+
+
+def test_older_scan_never_replaces_newer_snapshot(exports, engine, make_invoice):
+    """Publishes finishing out of order keep the newest scan's snapshot and charts."""
+    older = dashboard._scan(rescan=False)
+    engine.fin.save_invoice(make_invoice(invoice_id="INV-T002", order_id="ORD-GHOST2"))
+    newer = dashboard._scan(rescan=True)
+
+    assert dashboard._publish(*newer)
+    assert not dashboard._publish(*older)
+
+    assert dashboard._snapshot.scan_seq == newer[2]
+    assert len(dashboard._snapshot.results) == 2
+    assert dashboard._read_digest() == dashboard._results_digest(newer[0])
+    assert exports == [2]
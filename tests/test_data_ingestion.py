@@ -1,12 +1,17 @@
+import numpy as np
 import pytest
 from datetime import datetime, timedelta
 
 from backend.data.data_ingestor import DataIngestor
 from backend.data.config import GENERATOR_CONFIG
 
-def test_volume_and_entity_integrity():
-    generator = DataIngestor()
-    dataset = generator.generate()
+@pytest.fixture(scope="module")
+def default_dataset():
+    """Generation is deterministic, so one default dataset serves every read-only test."""
+    return DataIngestor().generate()
+
+def test_volume_and_entity_integrity(default_dataset):
+    dataset = default_dataset
 
     assert len(dataset.orders) == GENERATOR_CONFIG["num_transactions"]
     assert len(dataset.contacts) == GENERATOR_CONFIG["num_contacts"]
@@ -23,16 +28,15 @@ def test_anomaly_rates():
     dataset = generator.generate()
     
     total = len(dataset.orders)
+    types = np.array([a.type for a in dataset.anomaly_manifest], dtype=object)
     
     # Check missing invoices
-    missing_inv_count = sum(1 for a in dataset.anomaly_manifest if a.type == "missing_invoice")
     expected_missing = int(total * config["anomaly_rates"]["missing_invoice"])
-    assert missing_inv_count == expected_missing
+    assert (types == "missing_invoice").sum() == expected_missing
     
     # Check pricing drift
-    drift_count = sum(1 for a in dataset.anomaly_manifest if a.type == "pricing_drift")
     expected_drift = int(total * config["anomaly_rates"]["pricing_drift"])
-    assert drift_count == expected_drift
+    assert (types == "pricing_drift").sum() == expected_drift
 
 def test_determinism():
     gen1 = DataIngestor()
@@ -44,12 +48,11 @@ def test_determinism():
     assert ds1.orders[0].order_id == ds2.orders[0].order_id
     assert ds1.orders[0].total_amount == ds2.orders[0].total_amount
 
-def test_date_ranges():
-    generator = DataIngestor()
-    dataset = generator.generate()
+def test_date_ranges(default_dataset):
+    dataset = default_dataset
     
     total_months = GENERATOR_CONFIG["date_range_months"]
     start_limit = datetime.now() - timedelta(days=30 * total_months + 10)
     
-    for order in dataset.orders:
-        assert order.order_date.timestamp() > start_limit.timestamp()
+    # Orders carry naive local datetimes like start_limit, so compare them directly
+    assert all(order.order_date > start_limit for order in dataset.orders)
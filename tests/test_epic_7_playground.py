@@ -1,38 +1,49 @@
 import pytest
-from fastapi.testclient import TestClient
-from playground.openapi_interface import app
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 from backend.api.crm_store import CRMStore
 from backend.api.finance_store import FinanceStore
 import os
 
-client = TestClient(app)
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def client():
+    # Imported here so collecting this module does not build the playground app
+    from playground.openapi_interface import app
 
-def test_health_check():
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as ac:
+        yield ac
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_health_check(client):
     """GET /api/v1/system/health -> 200"""
-    response = client.get("/api/v1/system/health")
+    response = await client.get("/api/v1/system/health")
     assert response.status_code == 200
     assert response.json()["status"] == "ok"
 
-def test_system_info():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_system_info(client):
     """GET /api/v1/system/info -> 200"""
-    response = client.get("/api/v1/system/info")
+    response = await client.get("/api/v1/system/info")
     assert response.status_code == 200
     assert "version" in response.json()
     assert response.json()["title"] == "Revenue Guard Engine — API Playground"
 
-def test_playground_docs_load():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_playground_docs_load(client):
     """GET /playground -> 200 (Swagger UI)"""
-    response = client.get("/playground")
+    response = await client.get("/playground")
     assert response.status_code == 200
     assert "swagger" in response.text.lower() or "openapi" in response.text.lower()
 
-def test_redoc_loads():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_redoc_loads(client):
     """GET /docs -> 200 (ReDoc)"""
-    response = client.get("/docs")
+    response = await client.get("/docs")
     assert response.status_code == 200
     assert "redoc" in response.text.lower()
 
-def test_system_reset():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_system_reset(client):
     """POST /api/v1/system/reset -> 200"""
     # 1. Add some mock data to stores manually
     from backend.api.ghl_connector import get_store as get_crm_store
@@ -41,21 +52,74 @@ def test_system_reset():
     from datetime import datetime, timezone
     
     crm = get_crm_store()
-    crm.add_contact(Contact(
+    now = datetime.now(timezone.utc)
+    crm.add_contact(Contact.model_construct(
         contact_id="TEMP-123", name="Temp", email="t@t.com", 
-        company="T", created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc)
+        company="T", created_at=now, updated_at=now
     ))
     
     # 2. Reset
-    response = client.post("/api/v1/system/reset")
+    response = await client.post("/api/v1/system/reset")
     assert response.status_code == 200
     
     # 3. Verify TEMP-123 is gone
     with pytest.raises(Exception): # CRMStore raises CRMException which might be wrapped or specific
         crm.get_contact("TEMP-123")
 
-def test_root_redirect_info():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_reset_swaps_in_loaded_stores(client):
+    """POST /api/v1/system/reset replaces the store dicts instead of clearing them in place"""
+    from backend.api.ghl_connector import get_store as get_crm_store
+    from backend.api.qb_engine import get_store as get_finance_store
+
+    crm, finance = get_crm_store(), get_finance_store()
+    old_contacts, old_invoices = crm.contacts, finance.invoices
+    contacts_before, invoices_before = dict(old_contacts), dict(old_invoices)
+
+    response = await client.post("/api/v1/system/reset")
+    assert response.status_code == 200
+
+    # Readers still holding the old dicts see them untouched
+    assert crm.contacts is not old_contacts and old_contacts == contacts_before
+    assert finance.invoices is not old_invoices and old_invoices == invoices_before
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_seed_rejects_concurrent_runs(client):
+    """POST /api/v1/system/seed while a reseed is running -> 429"""
+    from playground.system_controller import _seed_lock
+
+    with _seed_lock:
+        response = await client.post("/api/v1/system/seed")
+    assert response.status_code == 429
+    assert not _seed_lock.locked()
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_seed_lock_not_held_by_unrun_job():
+    """A reseed whose background job never runs does not block later reseeds"""
+    from fastapi import BackgroundTasks
+    from playground.system_controller import _seed_lock, reseed_data
+
+    # Scheduled but never executed, as when background tasks are aborted
+    response = await reseed_data(BackgroundTasks())
+    assert response["status"] == "accepted"
+    assert not _seed_lock.locked()
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_root_redirect_info(client):
     """GET / -> 200 with playground URLs"""
-    response = client.get("/")
+    response = await client.get("/")
     assert response.status_code == 200
     assert "playground_url" in response.json()
+
+def test_uuid_pool_format():
+    """next_uuid() yields unique, valid RFC 4122 version-4 UUID strings"""
+    import uuid
+    from playground.uuidpool import next_uuid
+
+    ids = [next_uuid() for _ in range(600)]  # spans more than one pool refill
+    assert len(set(ids)) == len(ids)
+    for value in ids:
+        parsed = uuid.UUID(value)
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == value
@@ -1,3 +1,4 @@
+import operator
 import pytest
 from decimal import Decimal
 from datetime import date, timedelta
@@ -7,6 +8,9 @@ from backend.api.finance_store import FinanceStore
 from backend.api.ledger_service import LedgerService
 from backend.api.finance_business_rules import FinanceBusinessRules
 
+def _total(entries, attr):
+    return sum(map(operator.attrgetter(attr), entries), Decimal(0))
+
 @pytest.fixture
 def empty_store():
     return FinanceStore(data_dir="empty_path")
@@ -36,8 +40,8 @@ def test_double_entry_balance(empty_store, test_invoice):
     entries = empty_store.list_ledger()
     assert len(entries) == 2
     
-    total_debits = sum(e.debit for e in entries)
-    total_credits = sum(e.credit for e in entries)
+    total_debits = _total(entries, "debit")
+    total_credits = _total(entries, "credit")
     assert total_debits == total_credits
     assert total_debits == Decimal("1000.0")
 
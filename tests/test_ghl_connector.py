@@ -1,5 +1,6 @@
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 from datetime import datetime, timezone
 
 from backend.main import app
@@ -8,46 +9,57 @@ from backend.api.crm_store import CRMStore
 from backend.api.crm_models import Contact, Deal, Opportunity, Order, LineItem
 from decimal import Decimal
 
-client = TestClient(app)
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Shared timestamp for fixture entities; tests only need a plausible "now"
+_NOW = datetime.now(timezone.utc)
 
 # --- Test Fixtures & Setup ---
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def client():
+    # One transport and client for the whole module, driven by a shared event loop
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as ac:
+        yield ac
+
+@pytest.fixture(scope="session")
 def clean_store():
-    # Empty store for tests
-    store = CRMStore(data_dir="invalid_dir_to_prevent_load")
-    store.contacts.clear()
-    store.deals.clear()
-    store.opportunities.clear()
-    store.orders.clear()
-    return store
+    # Built once; the bogus data_dir keeps seed loading from running at all
+    return CRMStore(data_dir="invalid_dir_to_prevent_load")
+
+@pytest.fixture(autouse=True)
+def _auto_reset(clean_store):
+    # Empty store for each test
+    clean_store.reset()
 
 @pytest.fixture
 def override_get_store(clean_store):
     app.dependency_overrides[get_store] = lambda: clean_store
-    yield
-    app.dependency_overrides.clear()
+    try:
+        yield
+    finally:
+        app.dependency_overrides.clear()
 
 @pytest.fixture
 def setup_test_data(clean_store):
-    # Setup base relational entities
-    c = Contact(
+    # Setup base relational entities; inputs are trusted, so skip validation
+    c = Contact.model_construct(
         contact_id="CNT-TEST", name="Test User", email="test@test.com", 
-        company="Test Co", created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc)
+        company="Test Co", created_at=_NOW, updated_at=_NOW
     )
     clean_store.add_contact(c)
     
-    d = Deal(
+    d = Deal.model_construct(
         deal_id="DEL-TEST", contact_id="CNT-TEST", stage="proposal",
         value=Decimal("1000.00"), assigned_to="user1", 
-        created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc)
+        created_at=_NOW, updated_at=_NOW
     )
     clean_store.add_deal(d)
     
-    o = Opportunity(
+    o = Opportunity.model_construct(
         opportunity_id="OPP-TEST", deal_id="DEL-TEST", contact_id="CNT-TEST",
-        status="open", expected_close_date=datetime.now(timezone.utc),
-        created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc)
+        status="open", expected_close_date=_NOW,
+        created_at=_NOW, updated_at=_NOW
     )
     clean_store.add_opportunity(o)
     
@@ -55,7 +67,7 @@ def setup_test_data(clean_store):
 
 # --- Tests based on Acceptance Criteria ---
 
-def test_create_order(override_get_store, setup_test_data):
+async def test_create_order(client, override_get_store, setup_test_data):
     """POST a valid order, assert 201 and correct response body"""
     payload = {
         "opportunity_id": "OPP-TEST",
@@ -72,7 +84,7 @@ def test_create_order(override_get_store, setup_test_data):
         "discount_pct": "10.0"
     }
     
-    res = client.post("/api/v1/crm/orders", json=payload)
+    res = await client.post("/api/v1/crm/orders", json=payload)
     assert res.status_code == 201
     
     data = res.json()
@@ -85,7 +97,7 @@ def test_create_order(override_get_store, setup_test_data):
     assert data["approval_status"] == "pending"
     assert data["order_status"] == "draft"
 
-def test_discount_cap_enforcement(override_get_store, setup_test_data):
+async def test_discount_cap_enforcement(client, override_get_store, setup_test_data):
     """POST order with 20% discount and no approval -> assert 409"""
     payload = {
         "opportunity_id": "OPP-TEST",
@@ -97,11 +109,11 @@ def test_discount_cap_enforcement(override_get_store, setup_test_data):
     }
     
     # Creation blocks immediately
-    res = client.post("/api/v1/crm/orders", json=payload)
+    res = await client.post("/api/v1/crm/orders", json=payload)
     assert res.status_code == 409
     assert "discount" in res.json()["detail"].lower()
 
-def test_order_approval_flow(override_get_store, setup_test_data):
+async def test_order_approval_flow(client, override_get_store, setup_test_data):
     """Create order -> approve -> verify status change"""
     # 1. Create a safe order
     payload = {
@@ -110,48 +122,70 @@ def test_order_approval_flow(override_get_store, setup_test_data):
         "line_items": [{"product_id": "P1", "product_name": "Test", "quantity": 1, "unit_price": "100.0", "total_price": "100.0"}],
         "discount_pct": "0.0"
     }
-    res_create = client.post("/api/v1/crm/orders", json=payload)
+    res_create = await client.post("/api/v1/crm/orders", json=payload)
     order_id = res_create.json()["order_id"]
     
     # 2. Try to move to confirmed before approval -> Expect 409 Due to Invoice Gate
-    res_fail = client.put(f"/api/v1/crm/orders/{order_id}/status", json={"order_status": "confirmed"})
+    res_fail = await client.put(f"/api/v1/crm/orders/{order_id}/status", json={"order_status": "confirmed"})
     assert res_fail.status_code == 409
     
     # 3. Approve it
-    res_app = client.post(f"/api/v1/crm/orders/{order_id}/approve")
+    res_app = await client.post(f"/api/v1/crm/orders/{order_id}/approve")
     assert res_app.status_code == 200
     assert res_app.json()["approval_status"] == "approved"
     
     # 4. Move to confirmed
-    res_succ = client.put(f"/api/v1/crm/orders/{order_id}/status", json={"order_status": "confirmed"})
+    res_succ = await client.put(f"/api/v1/crm/orders/{order_id}/status", json={"order_status": "confirmed"})
     assert res_succ.status_code == 200
     assert res_succ.json()["order_status"] == "confirmed"
 
-def test_deal_stage_regression(override_get_store, setup_test_data):
+async def test_status_transition_updates_status_filter(client, override_get_store, setup_test_data):
+    """Approve + PUT status -> get_orders(status=...) moves the order between buckets"""
+    store = setup_test_data
+    payload = {
+        "opportunity_id": "OPP-TEST",
+        "contact_id": "CNT-TEST",
+        "line_items": [{"product_id": "P1", "product_name": "Test", "quantity": 1, "unit_price": "100.0", "total_price": "100.0"}],
+        "discount_pct": "0.0"
+    }
+    order_id = (await client.post("/api/v1/crm/orders", json=payload)).json()["order_id"]
+    await client.post(f"/api/v1/crm/orders/{order_id}/approve")
+
+    res = await client.put(f"/api/v1/crm/orders/{order_id}/status", json={"order_status": "confirmed"})
+    assert res.status_code == 200
+
+    confirmed, _ = store.get_orders(status="confirmed")
+    drafts, _ = store.get_orders(status="draft")
+    assert [o.order_id for o in confirmed] == [order_id]
+    assert drafts == []
+
+    res = await client.get("/api/v1/crm/orders", params={"status": "confirmed"})
+    assert [o["order_id"] for o in res.json()["data"]] == [order_id]
+
+async def test_deal_stage_regression(client, override_get_store, setup_test_data):
     """Attempt backward stage change -> assert 409"""
     # Setup deal is at "proposal"
-    res = client.put("/api/v1/crm/deals/DEL-TEST", json={"stage": "prospect"})
+    res = await client.put("/api/v1/crm/deals/DEL-TEST", json={"stage": "prospect"})
     assert res.status_code == 409
     assert "Cannot move deal backward" in res.json()["detail"]
 
-def test_contact_cascading(override_get_store, setup_test_data):
+async def test_contact_cascading(client, override_get_store, setup_test_data):
     """Delete contact -> verify related logic"""
     # Using our soft-delete spec
-    res = client.delete("/api/v1/crm/contacts/CNT-TEST")
+    res = await client.delete("/api/v1/crm/contacts/CNT-TEST")
     assert res.status_code == 204
     
     # Should still exist but be inactive
-    res_get = client.get("/api/v1/crm/contacts/CNT-TEST")
+    res_get = await client.get("/api/v1/crm/contacts/CNT-TEST")
     assert res_get.status_code == 200
     assert res_get.json()["is_active"] is False
 
-def test_filter_by_status_and_pagination(override_get_store, setup_test_data):
+async def test_filter_by_status_and_pagination(client, override_get_store, setup_test_data):
     """GET /orders?status=confirmed -> assert all returned orders are confirmed"""
     store = setup_test_data
     # Inject 5 draft, 5 confirmed
-    for i in range(10):
-        status = "draft" if i < 5 else "confirmed"
-        order = Order(
+    store.add_orders([
+        Order.model_construct(
             order_id=f"ORD-MULTI-{i}",
             opportunity_id="OPP-TEST",
             contact_id="CNT-TEST",
@@ -161,12 +195,13 @@ def test_filter_by_status_and_pagination(override_get_store, setup_test_data):
             discount_amount=Decimal("0"),
             total_amount=Decimal("100"),
             approval_status="pending",
-            order_status=status,
-            order_date=datetime.now(timezone.utc)
+            order_status="draft" if i < 5 else "confirmed",
+            order_date=_NOW
         )
-        store.add_order(order)
+        for i in range(10)
+    ])
         
-    res = client.get("/api/v1/crm/orders?status=confirmed&page=1&page_size=3")
+    res = await client.get("/api/v1/crm/orders?status=confirmed&page=1&page_size=3")
     assert res.status_code == 200
     data = res.json()
     assert len(data["data"]) == 3
@@ -6,40 +6,42 @@ overdue detection, void reversal, and reconciliation mismatch reporting.
 import pytest
 from datetime import date, timedelta
 from decimal import Decimal
-from fastapi.testclient import TestClient
 
-from backend.main import app
 from backend.api.finance_store import FinanceStore
-from backend.api.qb_engine import get_store, get_rules, get_ledger
+from backend.api.qb_engine import use_store, reset_store, get_ledger
 from backend.api.finance_models import Invoice, Payment
-from backend.api.ledger_service import LedgerService
-from backend.api.finance_business_rules import FinanceBusinessRules
-
-client = TestClient(app)
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def clean_store():
-    """Provides a fresh FinanceStore with no seeded data."""
-    store = FinanceStore(data_dir="/nonexistent/path")  # data_dir not found → empty store
-    return store
+    """Provides a FinanceStore with no seeded data, shared by every test."""
+    return FinanceStore(data_dir="/nonexistent/path")  # data_dir not found → empty store
+
+
+@pytest.fixture(autouse=True)
+def _auto_reset(clean_store):
+    """Empties the shared store before each test."""
+    clean_store.reset()
 
 
 @pytest.fixture
 def override_store(clean_store):
-    """Overrides app dependency to use a clean, isolated store."""
-    ledger = LedgerService(clean_store)
-    rules = FinanceBusinessRules(clean_store, ledger)
+    """Routes the finance dependencies to a clean, isolated store for this test."""
+    token = use_store(clean_store)
+    try:
+        yield clean_store
+    finally:
+        reset_store(token)
+
 
-    app.dependency_overrides[get_store] = lambda: clean_store
-    app.dependency_overrides[get_ledger] = lambda: ledger
-    app.dependency_overrides[get_rules] = lambda: rules
-    yield clean_store
-    app.dependency_overrides.clear()
+@pytest.fixture
+def ledger(override_store):
+    """The ledger service bound to the isolated store."""
+    return get_ledger()
 
 
 @pytest.fixture
@@ -68,7 +70,7 @@ def seeded_invoice(override_store):
 # Test: Invoice Creation
 # ---------------------------------------------------------------------------
 
-def test_create_invoice(override_store):
+def test_create_invoice(client, override_store):
     """POST /invoices creates a new invoice and returns 201 with correct fields."""
     payload = {
         "order_id": "ORD-NEW001",
@@ -88,7 +90,7 @@ def test_create_invoice(override_store):
 # Test: Double-Entry Balance
 # ---------------------------------------------------------------------------
 
-def test_double_entry_balance(override_store):
+def test_double_entry_balance(client, ledger):
     """After creating an invoice, total debits must equal total credits across all accounts."""
     payload = {
         "order_id": "ORD-LEDGER001",
@@ -97,13 +99,12 @@ def test_double_entry_balance(override_store):
     }
     client.post("/api/v1/finance/invoices", json=payload)
 
-    ledger_res = client.get("/api/v1/finance/ledger")
-    assert ledger_res.status_code == 200
-    entries = ledger_res.json()
+    entries = ledger.store.list_ledger()
+    assert entries
 
     # Verify the total debits across all entries equal total credits
-    total_debit = sum(Decimal(e["debit"]) for e in entries)
-    total_credit = sum(Decimal(e["credit"]) for e in entries)
+    total_debit = sum(e.debit for e in entries)
+    total_credit = sum(e.credit for e in entries)
     assert total_debit == total_credit, f"Balance broken: D={total_debit}, C={total_credit}"
 
 
@@ -111,7 +112,7 @@ def test_double_entry_balance(override_store):
 # Test: Overpayment Rejection
 # ---------------------------------------------------------------------------
 
-def test_overpayment_rejection(seeded_invoice, override_store):
+def test_overpayment_rejection(client, seeded_invoice, override_store):
     """POST /payments with amount > amount_due returns 409 Conflict."""
     payload = {
         "invoice_id": "INV-TEST001",
@@ -127,7 +128,7 @@ def test_overpayment_rejection(seeded_invoice, override_store):
 # Test: Successful Payment Updates Invoice Status
 # ---------------------------------------------------------------------------
 
-def test_payment_marks_invoice_paid(seeded_invoice, override_store):
+def test_payment_marks_invoice_paid(client, seeded_invoice, override_store):
     """POST /payments with full amount sets invoice status to 'paid'."""
     payload = {
         "invoice_id": "INV-TEST001",
@@ -147,7 +148,7 @@ def test_payment_marks_invoice_paid(seeded_invoice, override_store):
 # Test: Overdue Detection
 # ---------------------------------------------------------------------------
 
-def test_overdue_transition(override_store):
+def test_overdue_transition(client, override_store):
     """GET /invoices auto-detects overdue invoices past their due_date."""
     past_due = Invoice(
         invoice_id="INV-OVERDUE",
@@ -175,7 +176,7 @@ def test_overdue_transition(override_store):
 # Test: Void Invoice Reversal
 # ---------------------------------------------------------------------------
 
-def test_void_invoice_reversal(seeded_invoice, override_store):
+def test_void_invoice_reversal(client, seeded_invoice, override_store):
     """POST /invoices/{id}/void should mark invoice as void and generate reversal ledger entries."""
     # First create the invoice ledger entries by creating via POST
     # (seeded_invoice was added directly to store — create fresh for ledger tracking)
@@ -205,7 +206,7 @@ def test_void_invoice_reversal(seeded_invoice, override_store):
 # Test: Reconciliation Mismatches Endpoint
 # ---------------------------------------------------------------------------
 
-def test_reconciliation_endpoint(override_store):
+def test_reconciliation_endpoint(client, override_store):
     """GET /reconciliation/mismatches returns a valid list (can be empty on clean data)."""
     res = client.get("/api/v1/finance/reconciliation/mismatches")
     assert res.status_code == 200
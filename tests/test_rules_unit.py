@@ -0,0 +1,52 @@
+"""
+Epic 4 — Validation Rule Unit Tests
+
+Evaluates individual rules against hand-built contexts. Deliberately free of
+backend.main / TestClient so running these does not import the API graph.
+"""
+from decimal import Decimal
+
+from backend.core.validation_models import ValidationContext
+
+
+# ---------------------------------------------------------------------------
+# Test: PRC-001 — Unauthorized Discount
+# ---------------------------------------------------------------------------
+
+def test_prc001_unauthorized_discount(prc001, make_order):
+    """20% discount without approval → critical violation."""
+    order = make_order(discount_pct=Decimal("20"), approval_status="pending")
+    ctx = ValidationContext(order=order)
+    result = prc001.evaluate(ctx)
+    assert result is not None
+    assert result.rule_id == "PRC-001"
+    assert result.severity == "critical"
+
+
+# ---------------------------------------------------------------------------
+# Test: OIC-001 — Missing Invoice
+# ---------------------------------------------------------------------------
+
+def test_oic001_missing_invoice(oic001, make_order):
+    """Order with no invoice → critical violation."""
+    order = make_order()
+    ctx = ValidationContext(order=order, invoice=None, invoices=[])
+    result = oic001.evaluate(ctx)
+    assert result is not None
+    assert result.rule_id == "OIC-001"
+    assert result.severity == "critical"
+
+
+# ---------------------------------------------------------------------------
+# Test: OIC-002 — Amount Mismatch
+# ---------------------------------------------------------------------------
+
+def test_oic002_amount_mismatch(oic002, make_order, make_invoice):
+    """Invoice total ≠ order total → critical violation with drift."""
+    order = make_order(total_amount=Decimal("1000"))
+    invoice = make_invoice(total_amount=Decimal("950"))
+    ctx = ValidationContext(order=order, invoice=invoice, invoices=[invoice])
+    result = oic002.evaluate(ctx)
+    assert result is not None
+    assert result.rule_id == "OIC-002"
+    assert "mismatch" in result.message.lower()
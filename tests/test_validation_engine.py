@@ -2,36 +2,25 @@
 Epic 4 — Validation Engine Test Suite
 
 Covers:
-  • Individual rule evaluation
   • Risk score calculation & classification
   • Clean transaction validation
   • Batch validation
   • Full-scan endpoint
 """
 import pytest
-from datetime import datetime, date, timezone
+from datetime import datetime, timezone
 from decimal import Decimal
-from fastapi.testclient import TestClient
 
 from backend.main import app
 from backend.api.crm_store import CRMStore
-from backend.api.crm_models import Order, LineItem
 from backend.api.finance_store import FinanceStore
-from backend.api.finance_models import Invoice
 from backend.api.ghl_connector import get_store as get_crm_store
 from backend.api.qb_engine import get_store as get_finance_store
 from backend.api.validation_controller import get_engine, reset_engine
 from backend.core.reconciliation_engine import ReconciliationEngine
-from backend.core.validation_models import ValidationContext, RuleViolation
-from backend.core.rule_registry import (
-    PRC001_DiscountThreshold,
-    OIC001_OrderInvoiceMapping,
-    OIC002_AmountMatching,
-)
+from backend.core.validation_models import RuleViolation
 from backend.core import risk_scoring_engine
 
-client = TestClient(app)
-
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -77,27 +66,7 @@ def _make_opportunity(**overrides) -> Opportunity:
     defaults.update(overrides)
     return Opportunity(**defaults)
 
-def _make_order(**overrides) -> Order:
-    defaults = dict(
-        order_id="ORD-T001",
-        opportunity_id="OPP-T",
-        contact_id="CNT-T",
-        line_items=[
-            LineItem(product_id="P1", product_name="Widget", quantity=2, unit_price=Decimal("500"), total_price=Decimal("1000"))
-        ],
-        subtotal=Decimal("1000"),
-        discount_pct=Decimal("0"),
-        discount_amount=Decimal("0"),
-        total_amount=Decimal("1000"),
-        approval_status="pending",
-        order_status="confirmed",
-        order_date=datetime(2025, 6, 1, tzinfo=timezone.utc),
-    )
-    defaults.update(overrides)
-    return Order(**defaults)
-
-
-from backend.api.finance_models import Invoice, Payment
+from backend.api.finance_models import Payment
 
 def _make_payment(**overrides) -> Payment:
     defaults = dict(
@@ -113,38 +82,55 @@ def _make_payment(**overrides) -> Payment:
     defaults.update(overrides)
     return Payment(**defaults)
 
-def _make_invoice(**overrides) -> Invoice:
-    defaults = dict(
-        invoice_id="INV-T001",
-        order_id="ORD-T001",
-        customer_id="CNT-T",
-        line_items=[],
-        subtotal=Decimal("1000"),
-        tax_amount=Decimal("0"),
-        total_amount=Decimal("1000"),
-        amount_paid=Decimal("1000"),
-        amount_due=Decimal("0"),
-        status="paid",
-        issue_date=date(2025, 6, 1),
-        due_date=date(2025, 7, 1),
-        payment_terms="Net 30",
-    )
-    defaults.update(overrides)
-    return Invoice(**defaults)
+def _seed_clean_orders(stores, make_order, make_invoice, prefix, count):
+    """
+    Adds `count` fully invoiced and paid orders (ORD-<prefix><i>) under one
+    contact and deal. Templates are validated once and deep-copied per order,
+    so no two orders share a line_items list.
+    """
+    crm, fin = stores
+    contact = _make_contact()
+    deal = _make_deal(contact_id=contact.contact_id)
+    crm.add_contact(contact)
+    crm.add_deal(deal)
+    opp_tpl = _make_opportunity(contact_id=contact.contact_id, deal_id=deal.deal_id)
+    order_tpl = make_order(contact_id=contact.contact_id)
+    invoice_tpl = make_invoice(customer_id=contact.contact_id)
+    payment_tpl = _make_payment(customer_id=contact.contact_id, amount=invoice_tpl.total_amount)
+    opps, orders, invoices, payments = [], [], [], []
+    for i in range(count):
+        oid = f"ORD-{prefix}{i}"
+        opp_id = f"OPP-{prefix}{i}"
+        inv_id = f"INV-{prefix}{i}"
+        opps.append(opp_tpl.model_copy(update={"opportunity_id": opp_id}, deep=True))
+        orders.append(order_tpl.model_copy(update={"order_id": oid, "opportunity_id": opp_id}, deep=True))
+        invoices.append(invoice_tpl.model_copy(update={"invoice_id": inv_id, "order_id": oid}, deep=True))
+        payments.append(payment_tpl.model_copy(update={"invoice_id": inv_id}, deep=True))
+    crm.add_opportunities(opps)
+    crm.add_orders(orders)
+    fin.save_invoices(invoices)
+    fin.save_payments(payments)
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def clean_stores():
-    """Fresh CRM + Finance stores with no seeded data."""
+    """CRM + Finance stores with no seeded data, shared by every test."""
     crm = CRMStore(data_dir="/nonexistent")
     fin = FinanceStore(data_dir="/nonexistent")
     return crm, fin
 
 
+@pytest.fixture(autouse=True)
+def _auto_reset(clean_stores):
+    """Empties the shared stores before each test."""
+    for store in clean_stores:
+        store.reset()
+
+
 @pytest.fixture
 def override_engine(clean_stores):
     """Override app DI to use isolated stores."""
@@ -160,52 +146,6 @@ def override_engine(clean_stores):
     reset_engine()
 
 
-# ---------------------------------------------------------------------------
-# Test: PRC-001 — Unauthorized Discount
-# ---------------------------------------------------------------------------
-
-def test_prc001_unauthorized_discount():
-    """20% discount without approval → critical violation."""
-    order = _make_order(discount_pct=Decimal("20"), approval_status="pending")
-    ctx = ValidationContext(order=order)
-    rule = PRC001_DiscountThreshold()
-    result = rule.evaluate(ctx)
-    assert result is not None
-    assert result.rule_id == "PRC-001"
-    assert result.severity == "critical"
-
-
-# ---------------------------------------------------------------------------
-# Test: OIC-001 — Missing Invoice
-# ---------------------------------------------------------------------------
-
-def test_oic001_missing_invoice():
-    """Order with no invoice → critical violation."""
-    order = _make_order()
-    ctx = ValidationContext(order=order, invoice=None, invoices=[])
-    rule = OIC001_OrderInvoiceMapping()
-    result = rule.evaluate(ctx)
-    assert result is not None
-    assert result.rule_id == "OIC-001"
-    assert result.severity == "critical"
-
-
-# ---------------------------------------------------------------------------
-# Test: OIC-002 — Amount Mismatch
-# ---------------------------------------------------------------------------
-
-def test_oic002_amount_mismatch():
-    """Invoice total ≠ order total → critical violation with drift."""
-    order = _make_order(total_amount=Decimal("1000"))
-    invoice = _make_invoice(total_amount=Decimal("950"))
-    ctx = ValidationContext(order=order, invoice=invoice, invoices=[invoice])
-    rule = OIC002_AmountMatching()
-    result = rule.evaluate(ctx)
-    assert result is not None
-    assert result.rule_id == "OIC-002"
-    assert "mismatch" in result.message.lower()
-
-
 # ---------------------------------------------------------------------------
 # Test: Risk Score Calculation
 # ---------------------------------------------------------------------------
@@ -236,14 +176,14 @@ def test_risk_classification():
 # Test: Clean Transaction
 # ---------------------------------------------------------------------------
 
-def test_clean_transaction(override_engine, clean_stores):
+def test_clean_transaction(override_engine, clean_stores, make_order, make_invoice):
     """Order with matching invoice and no issues → score 0, safe."""
     crm, fin = clean_stores
     contact = _make_contact()
     deal = _make_deal(contact_id=contact.contact_id)
     opp = _make_opportunity(contact_id=contact.contact_id, deal_id=deal.deal_id)
-    order = _make_order(contact_id=contact.contact_id, opportunity_id=opp.opportunity_id)
-    invoice = _make_invoice(customer_id=contact.contact_id, order_id=order.order_id)
+    order = make_order(contact_id=contact.contact_id, opportunity_id=opp.opportunity_id)
+    invoice = make_invoice(customer_id=contact.contact_id, order_id=order.order_id)
     
     crm.add_contact(contact)
     crm.add_deal(deal)
@@ -263,22 +203,9 @@ def test_clean_transaction(override_engine, clean_stores):
 # Test: Batch Validation via API
 # ---------------------------------------------------------------------------
 
-def test_batch_validation(override_engine, clean_stores):
+def test_batch_validation(client, override_engine, clean_stores, make_order, make_invoice):
     """POST /validate/batch processes a list of order IDs."""
-    crm, fin = clean_stores
-    contact = _make_contact()
-    deal = _make_deal(contact_id=contact.contact_id)
-    crm.add_contact(contact)
-    crm.add_deal(deal)
-    for i in range(3):
-        oid = f"ORD-BATCH{i}"
-        opp_id = f"OPP-BATCH{i}"
-        opp = _make_opportunity(opportunity_id=opp_id, contact_id=contact.contact_id, deal_id=deal.deal_id)
-        crm.add_opportunity(opp)
-        crm.add_order(_make_order(order_id=oid, contact_id=contact.contact_id, opportunity_id=opp_id))
-        inv = _make_invoice(invoice_id=f"INV-BATCH{i}", order_id=oid, customer_id=contact.contact_id)
-        fin.save_invoice(inv)
-        fin.save_payment(_make_payment(invoice_id=inv.invoice_id, customer_id=contact.contact_id, amount=inv.total_amount))
+    _seed_clean_orders(clean_stores, make_order, make_invoice, "BATCH", 3)
 
     res = client.post("/api/v1/validation/validate/batch", json=["ORD-BATCH0", "ORD-BATCH1", "ORD-BATCH2"])
     assert res.status_code == 200
@@ -291,24 +218,27 @@ def test_batch_validation(override_engine, clean_stores):
 # Test: Full Scan via API
 # ---------------------------------------------------------------------------
 
-def test_full_scan_endpoint(override_engine, clean_stores):
+def test_full_scan_endpoint(client, override_engine, clean_stores, make_order, make_invoice):
     """POST /run-full-scan validates all CRM orders."""
-    crm, fin = clean_stores
-    contact = _make_contact()
-    deal = _make_deal(contact_id=contact.contact_id)
-    crm.add_contact(contact)
-    crm.add_deal(deal)
-    for i in range(5):
-        oid = f"ORD-SCAN{i}"
-        opp_id = f"OPP-SCAN{i}"
-        opp = _make_opportunity(opportunity_id=opp_id, contact_id=contact.contact_id, deal_id=deal.deal_id)
-        crm.add_opportunity(opp)
-        crm.add_order(_make_order(order_id=oid, contact_id=contact.contact_id, opportunity_id=opp_id))
-        inv = _make_invoice(invoice_id=f"INV-SCAN{i}", order_id=oid, customer_id=contact.contact_id)
-        fin.save_invoice(inv)
-        fin.save_payment(_make_payment(invoice_id=inv.invoice_id, customer_id=contact.contact_id, amount=inv.total_amount))
+    _seed_clean_orders(clean_stores, make_order, make_invoice, "SCAN", 5)
 
     res = client.post("/api/v1/validation/run-full-scan")
     assert res.status_code == 200
     data = res.json()
     assert len(data) == 5
+
+
+# ---------------------------------------------------------------------------
+# Test: Precomputed violation rule names
+# ---------------------------------------------------------------------------
+
+def test_result_carries_violation_rule_names(override_engine, clean_stores, make_invoice):
+    """Engine-built results list their violated rule names, kept out of API payloads."""
+    _, fin = clean_stores
+    fin.save_invoice(make_invoice(order_id="ORD-MISSING"))
+
+    override_engine.reconcile_all()
+    result = override_engine.get_result("ORD-MISSING")
+
+    assert result.violation_rule_names == tuple(v.rule_name for v in result.violations) == ("Ghost Invoice",)
+    assert "violation_rule_names" not in result.model_dump()
@@ -4,39 +4,33 @@ import numpy as np
 import pytest
 from visualization.risk_distribution_chart import generate_risk_distribution
 from visualization.validation_results_chart import generate_validation_donut
+from visualization.risk_over_time_chart import generate_risk_over_time
 
-def test_risk_histogram_structure():
+def test_risk_histogram_structure(tmp_path):
     """Verify that the risk histogram has exactly one axes object (no subplots)."""
     test_scores = [10, 20, 50, 80, 90]
-    output_path = "test_histogram.png"
+    output_path = str(tmp_path / "test_histogram.png")
     
     generate_risk_distribution(test_scores, output_path)
     
-    # Check if file exists
+    # Check if file exists, published without a leftover temp file
     assert os.path.exists(output_path)
     assert os.path.getsize(output_path) > 0
-    
-    # Clean up
-    if os.path.exists(output_path):
-        os.remove(output_path)
+    assert not os.path.exists(output_path + ".tmp")
 
-def test_donut_labels():
+def test_donut_labels(tmp_path):
     """Verify donut chart generation with known counts."""
     test_counts = {'Passed': 10, 'Warning': 5, 'Failed': 2}
-    output_path = "test_donut.png"
+    output_path = str(tmp_path / "test_donut.png")
     
     generate_validation_donut(test_counts, output_path)
     
     assert os.path.exists(output_path)
     assert os.path.getsize(output_path) > 0
-    
-    # Clean up
-    if os.path.exists(output_path):
-        os.remove(output_path)
 
-def test_no_data_handling():
+def test_no_data_handling(tmp_path):
     """Verify that charts handle empty data gracefully."""
-    output_path = "test_empty.png"
+    output_path = str(tmp_path / "test_empty.png")
     
     # Should not crash
     generate_risk_distribution([], output_path)
@@ -46,3 +40,139 @@ def test_no_data_handling():
     generate_validation_donut({}, output_path)
     assert os.path.exists(output_path)
     os.remove(output_path)
+
+    generate_risk_over_time([], [], output_path)
+    assert os.path.exists(output_path)
+
+def test_unchanged_chart_is_not_rerendered(tmp_path):
+    """Re-exporting identical inputs leaves the PNG alone; new inputs re-render it."""
+    from visualization.leakage_charts import generate_leakage_by_category
+    output_path = str(tmp_path / "test_leakage.png")
+
+    generate_leakage_by_category({"Pricing Drift": 3}, output_path)
+    first = os.stat(output_path).st_mtime_ns
+    with open(output_path + ".hash") as f:
+        first_key = f.read()
+
+    generate_leakage_by_category({"Pricing Drift": 3}, output_path)
+    assert os.stat(output_path).st_mtime_ns == first
+
+    generate_leakage_by_category({"Pricing Drift": 4}, output_path)
+    with open(output_path + ".hash") as f:
+        assert f.read() != first_key
+
+def test_overwriting_chart_drops_stale_hash(tmp_path):
+    """A different chart saved to the same path invalidates the cached key."""
+    from visualization.leakage_charts import generate_leakage_by_category
+    output_path = str(tmp_path / "shared.png")
+
+    generate_leakage_by_category({"Pricing Drift": 3}, output_path)
+    generate_risk_distribution([10, 90], output_path)
+    assert not os.path.exists(output_path + ".hash")
+
+    histogram = os.stat(output_path).st_mtime_ns
+    generate_leakage_by_category({"Pricing Drift": 3}, output_path)
+    assert os.stat(output_path).st_mtime_ns != histogram
+    assert os.path.exists(output_path + ".hash")
+
+def test_empty_donut_reuses_rendered_png(tmp_path):
+    """Every empty donut after the first is the same cached image."""
+    first = tmp_path / "empty_1.png"
+    second = tmp_path / "empty_2.png"
+
+    generate_validation_donut({}, str(first))
+    generate_validation_donut({'Passed': 0}, str(second))
+
+    assert first.read_bytes() == second.read_bytes()
+
+def test_svg_output(tmp_path):
+    """An .svg output path produces vector output instead of a PNG."""
+    output_path = tmp_path / "test_donut.svg"
+
+    generate_validation_donut({'Passed': 3, 'Failed': 1}, str(output_path))
+
+    assert b"<svg" in output_path.read_bytes()[:500]
+
+@pytest.mark.parametrize("scores", [
+    np.array([0, 5, 30, 30, 99, 100, 100]),           # integer tally path, top edge included
+    np.array([12, 40, 41, 77]),                       # even count
+    np.array([2.5, 50.0, 97.25]),                     # float path
+])
+def test_histogram_stats_match_numpy(scores):
+    """classify_and_count agrees with np.histogram / np.mean / np.median."""
+    from visualization._stats import classify_and_count
+
+    counts, mean_val, median_val = classify_and_count(scores, 20, (0, 100))
+
+    expected, _ = np.histogram(scores, bins=20, range=(0, 100))
+    assert counts.tolist() == expected.tolist()
+    assert mean_val == pytest.approx(np.mean(scores))
+    assert median_val == pytest.approx(np.median(scores))
+
+CHART_FILES = ["risk_distribution.png", "prevention_metrics.png", "validation_breakdown.png",
+               "leakage_categories.png", "risk_trend.png"]
+
+def _batch_inputs():
+    from datetime import date
+    return ([5, 40, 90], {'Passed': 1, 'Warning': 1, 'Failed': 1}, {"Pricing Drift": 2},
+            [date(2026, 1, 1), date(2026, 1, 2)], [40.0, 36.0])
+
+def _assert_charts_decode(output_dir):
+    for name in CHART_FILES:
+        image = plt.imread(os.path.join(output_dir, name))
+        assert image.ndim == 3 and image.size > 0
+
+def test_render_all_with_own_pool(tmp_path):
+    """render_all builds a pool when none is given and writes all five charts."""
+    from visualization.batch import render_all
+
+    written = render_all(*_batch_inputs(), str(tmp_path))
+
+    assert sorted(os.path.basename(p) for p in written) == sorted(CHART_FILES)
+    _assert_charts_decode(tmp_path)
+
+def test_export_all_with_injected_executor(tmp_path):
+    """ChartExporter hands rendering to an injected executor and leaves it open."""
+    from concurrent.futures import ProcessPoolExecutor
+    from datetime import datetime, timezone
+    from backend.core.validation_models import ValidationResult
+    from visualization.chart_exporter import ChartExporter
+
+    results = [
+        ValidationResult(order_id=f"ORD-{i}", risk_score=score, risk_classification=cls,
+                         validated_at=datetime(2026, 1, 1, tzinfo=timezone.utc))
+        for i, (score, cls) in enumerate([(5, "safe"), (40, "monitor"), (90, "critical")])
+    ]
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        ChartExporter(str(tmp_path)).export_all(results, executor=pool)
+        assert pool.submit(abs, -1).result() == 1
+
+    _assert_charts_decode(tmp_path)
+
+def test_sans_font_list_keeps_fallbacks():
+    """The installed font is tried first, but the whole fallback chain survives."""
+    from matplotlib import font_manager
+    from visualization.chart_config import CHART_STYLE
+
+    fonts = CHART_STYLE["font.sans-serif"]
+    assert sorted(fonts) == sorted(["Inter", "Roboto", "Arial", "DejaVu Sans"])
+    assert fonts[0] in {f.name for f in font_manager.fontManager.ttflist}
+
+def test_zone_bands_cached_only_for_shared_figure(tmp_path):
+    """Standalone trend charts reuse one set of band patches; caller axes are not retained."""
+    from datetime import date
+    from visualization import risk_over_time_chart
+
+    dates, scores = [date(2026, 1, 1), date(2026, 1, 2)], [10, 20]
+    generate_risk_over_time(dates, scores, str(tmp_path / "a.png"))
+    generate_risk_over_time(dates, scores, str(tmp_path / "b.png"))
+    cached = dict(risk_over_time_chart._zone_bands)
+    (shared_ax, bands), = cached.items()
+    assert len(shared_ax.patches) == len(bands) == 3
+
+    fig, ax = plt.subplots()
+    try:
+        generate_risk_over_time(dates, scores, str(tmp_path / "c.png"), ax=ax)
+    finally:
+        plt.close(fig)
+    assert risk_over_time_chart._zone_bands == cached
@@ -0,0 +1,46 @@
+"""
+Summary statistics behind the risk score histogram.
+"""
+import numpy as np
+
+def _float_stats(scores, bin_count, value_range):
+    """np.histogram plus one sum for the mean and a partial sort for the median."""
+    scores = np.asarray(scores, dtype=np.float32)
+    counts, _ = np.histogram(scores, bins=bin_count, range=value_range)
+    n = scores.size
+    k = n // 2
+    mean_val = scores.sum() / n
+    if n % 2:
+        median_val = np.partition(scores, k)[k]
+    else:
+        part = np.partition(scores, (k - 1, k))
+        median_val = 0.5 * (part[k - 1] + part[k])
+    return counts, mean_val, median_val
+
+def classify_and_count(scores, bin_count, value_range):
+    """
+    Returns (counts_per_bin, mean, median) for a non-empty 1-D score array.
+
+    Integer scores inside value_range (what the risk scoring engine produces)
+    are tallied once per possible value with np.bincount; the bin counts,
+    mean and median are then read off that short tally instead of making
+    separate passes over the scores. Anything else takes the float path.
+    """
+    lo, hi = value_range
+    width = (hi - lo) // bin_count
+    if (scores.dtype.kind not in "iu" or width * bin_count != hi - lo
+            or scores.min() < lo or scores.max() > hi):
+        return _float_stats(scores, bin_count, value_range)
+
+    tally = np.bincount(scores - lo, minlength=hi - lo + 1)
+    counts = tally[:-1].reshape(bin_count, width).sum(axis=1)
+    counts[-1] += tally[-1]  # the top edge belongs to the last bin, as in np.histogram
+
+    n = scores.size
+    values = np.arange(lo, hi + 1)
+    mean_val = (tally @ values) / n
+    # k-th smallest score (0-based) is the first value whose running count exceeds k
+    cumulative = np.cumsum(tally)
+    lower = values[np.searchsorted(cumulative, (n - 1) // 2, side="right")]
+    upper = values[np.searchsorted(cumulative, n // 2, side="right")]
+    return counts, mean_val, (lower + upper) / 2
@@ -0,0 +1,51 @@
+"""
+Parallel chart rendering: every dashboard chart is drawn in its own worker
+process, so a full report costs about as long as its slowest chart.
+"""
+import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Output file -> (module, generator); generators take their data args, then output_path
+CHART_GENERATORS = {
+    "risk_distribution.png": ("visualization.risk_distribution_chart", "generate_risk_distribution"),
+    "prevention_metrics.png": ("visualization.leakage_charts", "generate_prevention_metrics"),
+    "validation_breakdown.png": ("visualization.validation_results_chart", "generate_validation_donut"),
+    "leakage_categories.png": ("visualization.leakage_charts", "generate_leakage_by_category"),
+    "risk_trend.png": ("visualization.risk_over_time_chart", "generate_risk_over_time"),
+}
+
+def _render_chart(module_name, func_name, args, output_path):
+    """Worker entry point; matplotlib is imported here, never in the parent."""
+    import matplotlib
+    matplotlib.use("Agg")
+    generator = getattr(importlib.import_module(module_name), func_name)
+    generator(*args, output_path)
+    return output_path
+
+def render_all(risk_scores, counts, category_data, dates, avg_scores, output_dir, executor=None):
+    """
+    Renders the five dashboard charts concurrently into output_dir.
+    Takes the same inputs ChartExporter builds from validation results and
+    returns the written paths; a failing chart re-raises its worker's error.
+    Pass a long-lived executor to keep warm workers (matplotlib already
+    imported) across refreshes; otherwise a pool is created for this call.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    chart_args = {
+        "risk_distribution.png": (risk_scores,),
+        "prevention_metrics.png": (),
+        "validation_breakdown.png": (counts,),
+        "leakage_categories.png": (category_data,),
+        "risk_trend.png": (dates, avg_scores),
+    }
+
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=len(chart_args)) as pool:
+            return render_all(risk_scores, counts, category_data, dates, avg_scores, output_dir, pool)
+
+    futures = [
+        executor.submit(_render_chart, *CHART_GENERATORS[name], args, os.path.join(output_dir, name))
+        for name, args in chart_args.items()
+    ]
+    return [future.result() for future in futures]
@@ -1,6 +1,18 @@
 """
 Global configuration for Matplotlib charts to ensure consistent premium look.
 """
+import hashlib
+import io
+import os
+import struct
+
+import matplotlib as mpl
+import numpy as np
+
+try:  # zlib-ng is a faster drop-in for DEFLATE when it is installed
+    from zlib_ng import zlib_ng as zlib
+except ImportError:
+    import zlib
 
 # Colors
 COLOR_SAFE = "#2ecc71"      # Green
@@ -23,5 +35,160 @@ CHART_STYLE = {
     "font.sans-serif": ["Inter", "Roboto", "Arial", "DejaVu Sans"],
 }
 
+def _resolve_sans_font(candidates):
+    """
+    Returns the first candidate font that is actually installed (matplotlib's
+    bundled DejaVu Sans otherwise), with its file lookup already done.
+    """
+    from matplotlib import font_manager
+    installed = {f.name for f in font_manager.fontManager.ttflist}
+    name = next((c for c in candidates if c in installed), "DejaVu Sans")
+    font_manager.findfont(name)
+    return name
+
+# Probe once per process and move the installed font to the front, so titles
+# resolve on the first entry; the rest stay as matplotlib's glyph fallbacks
+_preferred_sans = _resolve_sans_font(CHART_STYLE["font.sans-serif"])
+CHART_STYLE["font.sans-serif"] = [_preferred_sans] + [
+    f for f in CHART_STYLE["font.sans-serif"] if f != _preferred_sans
+]
+
 PNG_DPI = 150
 PNG_TRANSPARENT = False
+# zlib level for PNG encoding; 3 is several times faster than Pillow's default
+# of 6 for flat chart graphics at a small size cost
+PNG_COMPRESS_LEVEL = 3
+
+_style_applied = False
+
+def apply_chart_style():
+    """Applies CHART_STYLE to the global rcParams once per process."""
+    global _style_applied
+    if not _style_applied:
+        mpl.rcParams.update(CHART_STYLE)
+        _style_applied = True
+
+# Figures kept alive between standalone generate_* calls, keyed by figsize
+_figures = {}
+
+def prepare_axes(ax, figsize):
+    """
+    Returns (fig, ax) ready to draw on, laid out by the constrained layout
+    engine at draw time (so charts never call tight_layout). With ax=None the
+    process-wide figure for figsize is reused (built on first use, outside
+    pyplot's registry); otherwise the caller's axes is cleared and its figure
+    resized for reuse.
+    """
+    if ax is None:
+        fig = _figures.get(figsize)
+        if fig is None:
+            from matplotlib.figure import Figure
+            fig = _figures[figsize] = Figure(figsize=figsize, layout="constrained")
+            return fig, fig.add_subplot()
+        ax = fig.axes[0]
+    fig = ax.figure
+    if fig.get_layout_engine() is None:
+        fig.set_layout_engine("constrained")
+    ax.clear()
+    # clear() keeps stale data limits, plus the equal aspect and hidden frame
+    # a previous pie chart leaves behind
+    ax.relim()
+    ax.set_aspect("auto")
+    ax.set_frame_on(True)
+    fig.set_size_inches(*figsize)
+    return fig, ax
+
+# Bump whenever a generator's drawing code changes, so cached charts re-render
+_RENDER_VERSION = 1
+
+# Everything besides the data that decides how a chart looks
+_RENDER_SETTINGS = repr((
+    _RENDER_VERSION, mpl.__version__, sorted(CHART_STYLE.items()),
+    PNG_DPI, PNG_TRANSPARENT, PNG_COMPRESS_LEVEL,
+))
+
+def chart_key(*inputs):
+    """Content hash of a chart's inputs plus the renderer version and style."""
+    return hashlib.sha1(repr((inputs, _RENDER_SETTINGS)).encode()).hexdigest()
+
+def chart_is_current(output_path, key):
+    """True when output_path exists and was last saved from inputs hashing to key."""
+    try:
+        with open(f"{output_path}.hash") as f:
+            return f.read() == key and os.path.exists(output_path)
+    except OSError:
+        return False
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def write_image(data, output_path, key=None):
+    """
+    Publishes encoded image bytes atomically, so readers never see a
+    half-written chart. A key from chart_key() is recorded next to the image
+    for chart_is_current(); without one, any earlier key is dropped so a
+    different chart saved to the same path is never mistaken as current.
+    """
+    hash_path = f"{output_path}.hash"
+    # Drop the old key first: if we stop midway the chart just re-renders
+    try:
+        os.remove(hash_path)
+    except FileNotFoundError:
+        pass
+    _write_atomic(output_path, data)
+    if key is not None:
+        _write_atomic(hash_path, key.encode())
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+def _png_chunk(tag, data):
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+def encode_png(rgba, width, height):
+    """
+    Minimal 8-bit RGBA PNG encoder: unfiltered scanlines deflated in one call.
+    Flat chart graphics compress about as well as with Pillow's adaptive
+    filters, in roughly two thirds of the time.
+    """
+    scanlines = np.zeros((height, width * 4 + 1), dtype=np.uint8)  # byte 0: filter "None"
+    scanlines[:, 1:] = np.frombuffer(rgba, dtype=np.uint8).reshape(height, width * 4)
+    ppm = round(PNG_DPI / 0.0254)
+    return b"".join((
+        _PNG_SIGNATURE,
+        _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)),
+        _png_chunk(b"pHYs", struct.pack(">IIB", ppm, ppm, 1)),
+        _png_chunk(b"IDAT", zlib.compress(scanlines, PNG_COMPRESS_LEVEL)),
+        _png_chunk(b"IEND", b""),
+    ))
+
+def image_format(output_path):
+    """'svg' for .svg paths (vector output, no rasterizing), 'png' otherwise."""
+    return "svg" if output_path.lower().endswith(".svg") else "png"
+
+def save_figure(fig, output_path, key=None):
+    """
+    Renders the figure in memory (SVG or PNG, by extension), publishes it
+    and returns the bytes.
+    """
+    buf = io.BytesIO()
+    if image_format(output_path) == "svg":
+        fig.savefig(buf, format="svg")
+        data = buf.getvalue()
+        write_image(data, output_path, key)
+        return data
+
+    fig.savefig(buf, format="rgba", dpi=PNG_DPI)
+    width, height = (int(d * PNG_DPI) for d in fig.get_size_inches())  # as Agg sizes it
+    if buf.tell() == width * height * 4:
+        png = encode_png(buf.getbuffer(), width, height)
+    else:
+        # Canvas size didn't come out as expected; let matplotlib/Pillow encode it
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=PNG_DPI,
+                    pil_kwargs={"compress_level": PNG_COMPRESS_LEVEL, "optimize": False})
+        png = buf.getvalue()
+    write_image(png, output_path, key)
+    return png
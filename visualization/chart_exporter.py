@@ -1,11 +1,9 @@
 import os
-import pandas as pd
+from collections import Counter, defaultdict
+from datetime import timedelta
+from itertools import chain
 from typing import List
 from backend.core.validation_models import ValidationResult
-from visualization.risk_distribution_chart import generate_risk_distribution
-from visualization.leakage_charts import generate_prevention_metrics, generate_leakage_by_category
-from visualization.validation_results_chart import generate_validation_donut
-from visualization.risk_over_time_chart import generate_risk_over_time
 
 class ChartExporter:
     """Orchestrates the generation of all dashboard charts."""
@@ -14,55 +12,89 @@ class ChartExporter:
         self.output_dir = output_dir
         os.makedirs(self.output_dir, exist_ok=True)
         
-    def export_all(self, results: List[ValidationResult]):
-        """Runs the full export suite."""
+    def export_all(self, results: List[ValidationResult], executor=None):
+        """
+        Runs the full export suite. With an executor (e.g. a long-lived
+        ProcessPoolExecutor) the charts render in parallel worker processes
+        via visualization.batch; otherwise they render in turn on one figure.
+        """
         if not results:
             print("No validation results to export.")
             return
 
+        chart_inputs = self._chart_inputs(results)
+        if executor is not None:
+            from visualization.batch import render_all
+            render_all(*chart_inputs, self.output_dir, executor=executor)
+        else:
+            self._export_charts(chart_inputs)
+
+        print(f"All charts exported to {self.output_dir}")
+
+    def _chart_inputs(self, results: List[ValidationResult]):
+        """
+        Returns (risk_scores, counts, category_data, dates, avg_scores): the
+        data args of the five charts, in the order visualization.batch takes them.
+        """
         # 1. Risk Distribution
         scores = [r.risk_score for r in results]
-        generate_risk_distribution(scores, os.path.join(self.output_dir, "risk_distribution.png"))
-        
-        # 2. Prevention Metrics (Static comparison for this demo)
-        generate_prevention_metrics(os.path.join(self.output_dir, "prevention_metrics.png"))
-        
+
         # 3. Validation Breakdown
+        cls_counts = Counter(r.risk_classification for r in results)
         counts = {
-            'Passed': sum(1 for r in results if r.risk_classification == 'safe'),
-            'Warning': sum(1 for r in results if r.risk_classification == 'monitor'),
-            'Failed': sum(1 for r in results if r.risk_classification == 'critical')
+            'Passed': cls_counts['safe'],
+            'Warning': cls_counts['monitor'],
+            'Failed': cls_counts['critical']
         }
-        generate_validation_donut(counts, os.path.join(self.output_dir, "validation_breakdown.png"))
-        
-        # 4. Leakage by Category
-        category_counts = {}
-        for r in results:
-            for v in r.violations:
-                category_counts[v.rule_name] = category_counts.get(v.rule_name, 0) + 1
-        
-        # Sort and take top 6
-        top_categories = dict(sorted(category_counts.items(), key=lambda item: item[1], reverse=True)[:6])
-        generate_leakage_by_category(top_categories, os.path.join(self.output_dir, "leakage_categories.png"))
-        
+
+        # 4. Leakage by Category (rule names precomputed when each result was built)
+        category_counts = Counter(chain.from_iterable(r.violation_rule_names for r in results))
+
+        # Top 6 (ties keep first-seen order, as the previous stable sort did)
+        top_categories = dict(category_counts.most_common(6))
+
         # 5. Risk Over Time (Simulated trend as we don't have historical store yet)
-        # We'll use the validated_at timestamps from the results
-        history_data = []
+        # We'll use the validated_at timestamps from the results, averaged per day
+        buckets = defaultdict(list)
         for r in results:
-            history_data.append({'date': r.validated_at.date(), 'score': r.risk_score})
-        
-        df = pd.DataFrame(history_data)
-        if not df.empty:
-            df['date'] = pd.to_datetime(df['date'])
-            trend_df = df.groupby('date')['score'].mean().reset_index()
-            trend_df.columns = ['date', 'avg_risk_score']
-            # If only one day, simulate a bit of a trend for visual effect
-            if len(trend_df) == 1:
-                 d2 = trend_df['date'].iloc[0] + pd.Timedelta(days=1)
-                 trend_df = pd.concat([trend_df, pd.DataFrame({'date': [d2], 'avg_risk_score': [trend_df['avg_risk_score'].iloc[0] * 0.9]})], ignore_index=True)
-            
-            generate_risk_over_time(trend_df, os.path.join(self.output_dir, "risk_trend.png"))
-        else:
-            generate_risk_over_time(pd.DataFrame(), os.path.join(self.output_dir, "risk_trend.png"))
-            
-        print(f"All charts exported to {self.output_dir}")
+            buckets[r.validated_at.date()].append(r.risk_score)
+
+        dates = sorted(buckets)
+        avg_scores = [sum(buckets[d]) / len(buckets[d]) for d in dates]
+        # If only one day, simulate a bit of a trend for visual effect
+        if len(dates) == 1:
+            dates.append(dates[0] + timedelta(days=1))
+            avg_scores.append(avg_scores[0] * 0.9)
+
+        return scores, counts, top_categories, dates, avg_scores
+
+    def _export_charts(self, chart_inputs):
+        """Renders each chart in turn onto one shared figure and saves it."""
+        # Deferred so importing the exporter does not pull in matplotlib.
+        # Batch export never needs a GUI canvas, so pin Agg before pyplot loads.
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        from visualization.chart_config import apply_chart_style
+        from visualization.risk_distribution_chart import generate_risk_distribution
+        from visualization.leakage_charts import generate_prevention_metrics, generate_leakage_by_category
+        from visualization.validation_results_chart import generate_validation_donut
+        from visualization.risk_over_time_chart import generate_risk_over_time
+
+        scores, counts, top_categories, dates, avg_scores = chart_inputs
+
+        # One figure is reused across every chart; each generator clears and resizes it.
+        # The style must be in place before the figure exists so it picks up the colors.
+        apply_chart_style()
+        fig, ax = plt.subplots(figsize=(10, 6), layout="constrained")
+        try:
+            generate_risk_distribution(scores, os.path.join(self.output_dir, "risk_distribution.png"), ax=ax)
+
+            # 2. Prevention Metrics (Static comparison for this demo)
+            generate_prevention_metrics(os.path.join(self.output_dir, "prevention_metrics.png"), ax=ax)
+
+            generate_validation_donut(counts, os.path.join(self.output_dir, "validation_breakdown.png"), ax=ax)
+            generate_leakage_by_category(top_categories, os.path.join(self.output_dir, "leakage_categories.png"), ax=ax)
+            generate_risk_over_time(dates, avg_scores, os.path.join(self.output_dir, "risk_trend.png"), ax=ax)
+        finally:
+            plt.close(fig)
@@ -1,63 +1,70 @@
-import matplotlib.pyplot as plt
 import numpy as np
 from visualization.chart_config import (
-    COLOR_SAFE, COLOR_MONITOR, COLOR_CRITICAL, CHART_STYLE, PNG_DPI
+    COLOR_SAFE, COLOR_MONITOR, COLOR_CRITICAL, apply_chart_style, prepare_axes, save_figure,
+    chart_key, chart_is_current
 )
 
-def generate_prevention_metrics(output_path):
+# Static before/after comparison data for the prevention chart
+PREVENTION_CATEGORIES = ['Manual Review\nTime (Hrs)', 'Error Detection\nRate (%)', 'Audit\nVisibility (%)']
+PREVENTION_BEFORE = [40, 35, 20]
+PREVENTION_AFTER = [8, 94, 98]
+# Manual Review: -80%, Error Detection: +169%, Audit Visibility: +390%
+PREVENTION_CHANGES = ["-80%", "+169%", "+390%"]
+_PREVENTION_X = np.arange(len(PREVENTION_CATEGORIES))
+_BAR_WIDTH = 0.35
+
+def generate_prevention_metrics(output_path, ax=None):
     """
     Generates Chart 2: Revenue Leakage Prevention (Grouped Bar)
     Comparing Before Automation vs After Engine.
+    Pass ax to draw onto an existing axes instead of a new figure.
+    Skips rendering when output_path already holds this exact chart.
     """
-    plt.rcParams.update(CHART_STYLE)
-    
-    categories = ['Manual Review\nTime (Hrs)', 'Error Detection\nRate (%)', 'Audit\nVisibility (%)']
-    before = [40, 35, 20]
-    after = [8, 94, 98]
+    key = chart_key("prevention", PREVENTION_CATEGORIES, PREVENTION_BEFORE,
+                    PREVENTION_AFTER, PREVENTION_CHANGES)
+    if chart_is_current(output_path, key):
+        return
+
+    apply_chart_style()
     
-    x = np.arange(len(categories))
-    width = 0.35
+    x = _PREVENTION_X
+    width = _BAR_WIDTH
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = prepare_axes(ax, (10, 6))
     
-    rects1 = ax.bar(x - width/2, before, width, label='Before Engine', color='#585b70', alpha=0.8)
-    rects2 = ax.bar(x + width/2, after, width, label='With Revenue Guard', color=COLOR_SAFE, alpha=0.9)
+    ax.bar(x - width/2, PREVENTION_BEFORE, width, label='Before Engine', color='#585b70', alpha=0.8)
+    rects2 = ax.bar(x + width/2, PREVENTION_AFTER, width, label='With Revenue Guard', color=COLOR_SAFE, alpha=0.9)
     
     ax.set_title("Engine Efficiency & Performance Gains", fontsize=16, pad=20)
     ax.set_xticks(x)
-    ax.set_xticklabels(categories)
+    ax.set_xticklabels(PREVENTION_CATEGORIES)
     ax.legend(facecolor='#313244', edgecolor='#45475a')
     
-    # Add percentage change labels
-    # Manual Review: -80%, Error Detection: +169%, Audit Visibility: +390%
-    changes = ["-80%", "+169%", "+390%"]
-    
-    for i, p in enumerate(rects2):
-        height = p.get_height()
-        ax.annotate(changes[i],
-                    xy=(p.get_x() + p.get_width() / 2, height),
-                    xytext=(0, 5),  # 5 points vertical offset
-                    textcoords="offset points",
-                    ha='center', va='bottom', fontsize=10, fontweight='bold', color=COLOR_SAFE)
+    # Add percentage change labels, 5 points above each "after" bar
+    ax.bar_label(rects2, labels=PREVENTION_CHANGES, padding=5,
+                 fontsize=10, fontweight='bold', color=COLOR_SAFE)
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=PNG_DPI)
-    plt.close()
+    save_figure(fig, output_path, key)
 
-def generate_leakage_by_category(category_data, output_path):
+def generate_leakage_by_category(category_data, output_path, ax=None):
     """
     Generates Chart 4: Leakage by Category (Horizontal Bar)
     category_data: Dict mapping category name to count/impact
+    Pass ax to draw onto an existing axes instead of a new figure.
+    Skips rendering when output_path already holds this exact chart.
     """
     if not category_data:
         category_data = {"N/A": 0}
 
-    plt.rcParams.update(CHART_STYLE)
-    
     categories = list(category_data.keys())
     values = list(category_data.values())
+    key = chart_key("leakage", categories, values)
+    if chart_is_current(output_path, key):
+        return
+
+    apply_chart_style()
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = prepare_axes(ax, (10, 6))
     
     y_pos = np.arange(len(categories))
     
@@ -70,11 +77,9 @@ def generate_leakage_by_category(category_data, output_path):
     ax.set_xlabel('Anomaly Count / Risk Impact')
     ax.set_title('Top Revenue Leakage Categories', fontsize=16, pad=20)
     
-    plt.grid(True, axis='x', linestyle='--', alpha=0.3)
+    ax.grid(True, axis='x', linestyle='--', alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=PNG_DPI)
-    plt.close()
+    save_figure(fig, output_path, key)
 
 if __name__ == "__main__":
     generate_prevention_metrics("prevention_test.png")
@@ -1,51 +1,58 @@
-import matplotlib.pyplot as plt
 import numpy as np
+from visualization._stats import classify_and_count
 from visualization.chart_config import (
-    COLOR_SAFE, COLOR_MONITOR, COLOR_CRITICAL, CHART_STYLE, PNG_DPI
+    COLOR_SAFE, COLOR_MONITOR, COLOR_CRITICAL, apply_chart_style, prepare_axes, save_figure
 )
 
-def generate_risk_distribution(risk_scores, output_path):
+# Fixed histogram layout: 20 five-point bins over 0-100
+_BIN_COUNT = 20
+_BIN_RANGE = (0, 100)
+_BIN_EDGES = np.linspace(*_BIN_RANGE, _BIN_COUNT + 1)
+# Contiguous (start, stop) bin ranges per zone: Safe (0-30), Monitor (30-70), Critical (70-100)
+_MONITOR_START, _CRITICAL_START = np.searchsorted(_BIN_EDGES[:-1], [30, 70])
+_ZONE_BINS = (
+    (0, _MONITOR_START, COLOR_SAFE),
+    (_MONITOR_START, _CRITICAL_START, COLOR_MONITOR),
+    (_CRITICAL_START, _BIN_COUNT, COLOR_CRITICAL),
+)
+
+def generate_risk_distribution(risk_scores, output_path, ax=None):
     """
     Generates a histogram of risk scores with color-coded zones.
     Chart 1: Risk Score Distribution (Histogram)
+    Pass ax to draw onto an existing axes instead of a new figure.
     """
-    if not risk_scores:
-        risk_scores = [0] # Handle empty data
+    risk_scores = np.asarray(risk_scores)
+    if risk_scores.size == 0:
+        risk_scores = np.zeros(1, dtype=np.int64) # Handle empty data
         
-    plt.rcParams.update(CHART_STYLE)
-    fig, ax = plt.subplots(figsize=(10, 6))
+    apply_chart_style()
+    fig, ax = prepare_axes(ax, (10, 6))
     
-    # 20 bins for 0-100
-    n, bins, patches = ax.hist(risk_scores, bins=20, range=(0, 100), edgecolor='#11111b', alpha=0.8)
-    
-    # Color bins based on zones
-    # Safe (0-30), Monitor (30-70), Critical (70-100)
-    for i in range(len(patches)):
-        bin_center = (bins[i] + bins[i+1]) / 2
-        if bin_center < 30:
-            patches[i].set_facecolor(COLOR_SAFE)
-        elif bin_center < 70:
-            patches[i].set_facecolor(COLOR_MONITOR)
-        else:
-            patches[i].set_facecolor(COLOR_CRITICAL)
+    # Binned in numpy, drawn as one filled step outline (a single artist) per zone.
+    # Zones without scores are skipped rather than stroked along the baseline,
+    # so the full score range is put into the data limits explicitly.
+    counts, mean_val, median_val = classify_and_count(risk_scores, _BIN_COUNT, _BIN_RANGE)
+    ax.update_datalim([(_BIN_RANGE[0], 0), (_BIN_RANGE[1], 0)])
+    for start, stop, color in _ZONE_BINS:
+        if not counts[start:stop].any():
+            continue
+        ax.stairs(counts[start:stop], _BIN_EDGES[start:stop + 1], fill=True,
+                  color=color, edgecolor='#11111b', linewidth=1, alpha=0.8)
             
     # Annotations
-    mean_val = np.mean(risk_scores)
-    median_val = np.median(risk_scores)
-    
     ax.axvline(mean_val, color='#ffffff', linestyle='--', linewidth=2, label=f'Mean: {mean_val:.1f}')
     ax.axvline(median_val, color='#89dceb', linestyle=':', linewidth=2, label=f'Median: {median_val:.1f}')
     
     ax.set_title("Risk Score Distribution Across Transactions", fontsize=16, pad=20)
     ax.set_xlabel("Risk Score (0-100)")
     ax.set_ylabel("Number of Transactions")
-    ax.legend(facecolor='#313244', edgecolor='#45475a')
+    # loc='best' can't see gaps inside the zone step patches, so place it explicitly
+    ax.legend(facecolor='#313244', edgecolor='#45475a', loc='upper left')
     
-    plt.grid(True, axis='y', linestyle='--', alpha=0.3)
+    ax.grid(True, axis='y', linestyle='--', alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=PNG_DPI)
-    plt.close()
+    save_figure(fig, output_path)
 
 if __name__ == "__main__":
     # Test generation
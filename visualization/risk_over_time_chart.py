@@ -1,31 +1,67 @@
-import matplotlib.pyplot as plt
-import pandas as pd
+import numpy as np
+from matplotlib.patches import Rectangle
 from visualization.chart_config import (
-    COLOR_SAFE, COLOR_MONITOR, COLOR_CRITICAL, CHART_STYLE, PNG_DPI
+    COLOR_SAFE, COLOR_MONITOR, COLOR_CRITICAL, apply_chart_style, prepare_axes, save_figure
 )
 
-def generate_risk_over_time(history_df, output_path):
+# Placeholder series drawn when there is no history: six flat month-ends of 2024.
+# Built with numpy since pandas' month-end alias differs between versions.
+_EMPTY_DATES = (np.arange('2024-02', '2024-08', dtype='datetime64[M]').astype('datetime64[D]') - 1
+                ).astype('datetime64[ns]')
+_EMPTY_SCORES = np.zeros(len(_EMPTY_DATES), dtype=np.float32)
+
+# (bottom, top, color, label) of the background risk zone bands
+_ZONE_BANDS = (
+    (0, 30, COLOR_SAFE, 'Safe Zone'),
+    (30, 70, COLOR_MONITOR, 'Monitor Zone'),
+    (70, 100, COLOR_CRITICAL, 'Critical Zone'),
+)
+
+# Band patches of the process-wide figure prepare_axes() reuses, keyed by its
+# axes. Caller-supplied axes get fresh patches so nothing here keeps them alive.
+_zone_bands = {}
+
+def _zone_band_patches(ax, reuse):
+    """
+    Full-width band patches for ax. With reuse, they are built on first use
+    and kept in _zone_bands (ax.clear() detaches them, so they can simply be
+    added again).
+    """
+    patches = _zone_bands.get(ax) if reuse else None
+    if patches is None:
+        transform = ax.get_yaxis_transform()  # x in axes fraction, y in data
+        patches = tuple(
+            Rectangle((0, bottom), 1, top - bottom, transform=transform,
+                      color=color, alpha=0.1, label=label)
+            for bottom, top, color, label in _ZONE_BANDS
+        )
+        if reuse:
+            _zone_bands[ax] = patches
+    return patches
+
+def generate_risk_over_time(dates, avg_scores, output_path, ax=None):
     """
     Generates Chart 5: Risk Score Over Time (Line Chart)
-    history_df: DataFrame with 'date' and 'avg_risk_score' columns
+    dates, avg_scores: parallel sequences of period dates and average risk scores
+    Pass ax to draw onto an existing axes instead of a new figure.
     """
-    plt.rcParams.update(CHART_STYLE)
+    apply_chart_style()
     
-    if history_df.empty:
-        # Create dummy data if empty
-        history_df = pd.DataFrame({
-            'date': pd.date_range(start='2024-01-01', periods=6, freq='M'),
-            'avg_risk_score': [0] * 6
-        })
+    if len(dates) == 0:
+        dates, avg_scores = _EMPTY_DATES, _EMPTY_SCORES
+    else:
+        # Plot plain numpy arrays so matplotlib skips per-element type inference
+        dates = np.asarray(dates, dtype="datetime64[ns]")
+        avg_scores = np.asarray(avg_scores, dtype=np.float32)
 
-    fig, ax = plt.subplots(figsize=(12, 6))
+    shared_figure = ax is None
+    fig, ax = prepare_axes(ax, (12, 6))
     
     # Zones bands
-    ax.axhspan(0, 30, color=COLOR_SAFE, alpha=0.1, label='Safe Zone')
-    ax.axhspan(30, 70, color=COLOR_MONITOR, alpha=0.1, label='Monitor Zone')
-    ax.axhspan(70, 100, color=COLOR_CRITICAL, alpha=0.1, label='Critical Zone')
+    for band in _zone_band_patches(ax, reuse=shared_figure):
+        ax.add_patch(band)
     
-    ax.plot(history_df['date'], history_df['avg_risk_score'], 
+    ax.plot(dates, avg_scores, 
             marker='o', color='#ffffff', linewidth=3, markersize=8, 
             label='Avg Risk Score')
     
@@ -36,15 +72,11 @@ def generate_risk_over_time(history_df, output_path):
     
     ax.legend(facecolor='#313244', edgecolor='#45475a', loc='upper left')
     
-    plt.grid(True, linestyle='--', alpha=0.2)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=PNG_DPI)
-    plt.close()
+    ax.grid(True, linestyle='--', alpha=0.2)
+    save_figure(fig, output_path)
 
 if __name__ == "__main__":
     # Test data
-    dates = pd.date_range(start='2024-01-01', periods=6, freq='M')
     scores = [25, 28, 45, 32, 22, 18]
-    test_df = pd.DataFrame({'date': dates, 'avg_risk_score': scores})
-    generate_risk_over_time(test_df, "risk_time_test.png")
+    generate_risk_over_time(_EMPTY_DATES, scores, "risk_time_test.png")
     print("Test chart generated: risk_time_test.png")
@@ -1,63 +1,71 @@
-import matplotlib.pyplot as plt
+import numpy as np
 from visualization.chart_config import (
-    COLOR_SAFE, COLOR_MONITOR, COLOR_CRITICAL, CHART_STYLE, PNG_DPI
+    COLOR_SAFE, COLOR_MONITOR, COLOR_CRITICAL, apply_chart_style, prepare_axes, save_figure,
+    write_image, image_format
 )
 
-def generate_validation_donut(counts, output_path):
+_LABELS = np.array(['Passed', 'Warning', 'Failed'])
+_COLORS = np.array([COLOR_SAFE, COLOR_MONITOR, COLOR_CRITICAL])
+_WEDGE_PROPS = {'width': 0.4, 'edgecolor': '#11111b'}
+
+# The "No Data" donut never changes, so it is rendered once per image format
+# and then reused
+_no_data_images = {}
+
+def generate_validation_donut(counts, output_path, ax=None):
     """
     Generates Chart 3: Validation Result Breakdown (Donut)
     counts: Dict with 'Passed', 'Warning', 'Failed' keys
+    Pass ax to draw onto an existing axes instead of a new figure.
     """
-    plt.rcParams.update(CHART_STYLE)
+    apply_chart_style()
     
-    labels = ['Passed', 'Warning', 'Failed']
-    sizes = [counts.get('Passed', 0), counts.get('Warning', 0), counts.get('Failed', 0)]
-    colors = [COLOR_SAFE, COLOR_MONITOR, COLOR_CRITICAL]
+    sizes = np.array([counts.get(label, 0) for label in _LABELS])
     
     # Filter out empty segments to avoid warnings/clutter
-    filtered_labels = []
-    filtered_sizes = []
-    filtered_colors = []
-    for l, s, c in zip(labels, sizes, colors):
-        if s > 0:
-            filtered_labels.append(l)
-            filtered_sizes.append(s)
-            filtered_colors.append(c)
+    mask = sizes > 0
+    filtered_labels = _LABELS[mask].tolist()
+    filtered_sizes = sizes[mask].astype(np.float32)  # pie would convert it anyway
+    filtered_colors = _COLORS[mask].tolist()
             
-    if not filtered_sizes:
+    if filtered_sizes.size == 0:
+        cached = _no_data_images.get(image_format(output_path))
+        if cached is not None:
+            write_image(cached, output_path)
+            return
         filtered_labels = ['No Data']
-        filtered_sizes = [1]
+        filtered_sizes = np.ones(1, dtype=np.float32)
         filtered_colors = ['#585b70']
 
-    fig, ax = plt.subplots(figsize=(8, 8))
+    # Percentages are formatted up front and share each wedge's label
+    shown_total = filtered_sizes.sum()
+    wedge_labels = [f"{label}\n{100 * size / shown_total:.1f}%"
+                    for label, size in zip(filtered_labels, filtered_sizes)]
+
+    fig, ax = prepare_axes(ax, (8, 8))
     
-    wedges, texts, autotexts = ax.pie(
+    wedges, texts = ax.pie(
         filtered_sizes, 
-        labels=filtered_labels, 
+        labels=wedge_labels, 
         colors=filtered_colors,
-        autopct='%1.1f%%', 
         startangle=140, 
-        pctdistance=0.85,
-        wedgeprops={'width': 0.4, 'edgecolor': '#11111b'}
+        wedgeprops=_WEDGE_PROPS
     )
     
     # Style the text
     for text in texts:
         text.set_color('white')
         text.set_fontsize(12)
-    for autotext in autotexts:
-        autotext.set_color('white')
-        autotext.set_fontweight('bold')
         
     ax.set_title("System Health: Validation Outcomes", fontsize=16, pad=20)
     
     # Add total count in center
-    total = sum(sizes)
+    total = int(sizes.sum())
     ax.text(0, 0, f"Total\n{total}", ha='center', va='center', fontsize=20, fontweight='bold', color='white')
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=PNG_DPI)
-    plt.close()
+    image = save_figure(fig, output_path)
+    if total == 0:
+        _no_data_images[image_format(output_path)] = image
 
 if __name__ == "__main__":
     test_counts = {'Passed': 750, 'Warning': 180, 'Failed': 70}